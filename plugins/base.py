@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Callable, Optional
 import inspect
 
+from plugins.common import resource_data, resource_text
+
 
 class BasePlugin(ABC):
     """
@@ -58,6 +60,33 @@ class BasePlugin(ABC):
         Override this to perform cleanup tasks.
         """
         pass
+    
+    def load_resource(self, filename: str) -> Any:
+        """
+        Parsed JSON of a file in the shared resources directory.
+        
+        The file is read and parsed once per process and the result is shared
+        by every plugin that loads it, so the parsed data must not be modified.
+        
+        Args:
+            filename: Name of the file inside the resources directory
+        
+        Returns:
+            The parsed JSON
+        """
+        return resource_data(filename)
+    
+    def serve_resource(self, filename: str) -> str:
+        """
+        Text for a resource endpoint, served the same way as by server.py.
+        
+        Args:
+            filename: Name of the file inside the resources directory
+        
+        Returns:
+            The minified resource JSON
+        """
+        return resource_text(filename)
 
 
 class PluginRegistry:
@@ -0,0 +1,250 @@
+"""
+Helpers shared by server.py and the plugins
+
+Kept separate from base.py so the single-file server can reuse them without
+depending on the plugin classes.
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Any
+
+# Optional fast non-cryptographic hash for text watermark content ids
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Use orjson for parsing and minifying the resource files when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+
+# Shared resources directory (one level above the plugins package)
+RESOURCES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resources")
+
+# AI_ACT_CACHE_RESOURCES=0 makes the resource endpoints re-read a file when
+# its mtime changes, so JSON edits show up without a restart (development)
+CACHE_RESOURCES = os.getenv("AI_ACT_CACHE_RESOURCES", "1") != "0"
+
+# Parsed JSON and served text of the resource files loaded so far, keyed by
+# file name, and the mtime each text was last revalidated against
+_resource_data: Dict[str, Any] = {}
+_resource_texts: Dict[str, str] = {}
+_resource_mtimes: Dict[str, int] = {}
+
+
+def _parse_resource(filename: str) -> Any:
+    """
+    Read and parse a resource file, naming the file if its JSON is malformed.
+    Unbuffered readall() reads the whole file in one read() call, and the raw
+    UTF-8 bytes go straight to the parser (orjson and json.loads both take
+    bytes).
+    """
+    path = os.path.join(RESOURCES_DIR, filename)
+    with open(path, 'rb', buffering=0) as f:
+        raw = f.readall()
+    try:
+        return _json_loads(raw)
+    except ValueError as e:
+        raise ValueError(f"Malformed JSON in resource file '{path}': {e}") from e
+
+
+def _minify(data: Any) -> str:
+    """Serialize parsed resource JSON compactly for the resource endpoints."""
+    if orjson is not None:
+        # orjson emits the same compact UTF-8 form as the json fallback below
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+
+def resource_data(filename: str) -> Any:
+    """
+    Parsed JSON of a resource file, read once per process. Every caller gets
+    the same object, so it must not be modified.
+    """
+    try:
+        return _resource_data[filename]
+    except KeyError:
+        data = _resource_data[filename] = _parse_resource(filename)
+        return data
+
+
+def resource_text(filename: str) -> str:
+    """Minified text served for a resource file, revalidated by mtime when caching is off."""
+    if not CACHE_RESOURCES:
+        mtime = os.stat(os.path.join(RESOURCES_DIR, filename)).st_mtime_ns
+        if _resource_mtimes.get(filename) != mtime:
+            _resource_texts[filename] = _minify(_parse_resource(filename))
+            _resource_mtimes[filename] = mtime
+        return _resource_texts[filename]
+    try:
+        return _resource_texts[filename]
+    except KeyError:
+        text = _resource_texts[filename] = _minify(resource_data(filename))
+        return text
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last timestamp handed out
+_timestamp_cache = [(-1, "")]
+
+
+def utc_timestamp() -> str:
+    """
+    Current UTC time as an ISO-8601 string with microseconds, the same as
+    datetime.now(timezone.utc).isoformat(timespec="microseconds"). The date
+    and time of day are reformatted only when the second changes; each call
+    just appends its microseconds and the offset.
+    """
+    seconds, microseconds = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _timestamp_cache[0]
+    if seconds != cached_second:
+        prefix = datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _timestamp_cache[0] = (seconds, prefix)
+    return f"{prefix}.{microseconds:06d}+00:00"
+
+
+def sha256_content_hash(value: str) -> str:
+    """16-hex-char content id from SHA-256 (the default)."""
+    # An integrity tag, not a cryptographic commitment, so OpenSSL may use
+    # its non-FIPS (SHA-NI) code path
+    return hashlib.sha256(value.encode('utf-8'), usedforsecurity=False).digest()[:8].hex()
+
+
+def xxh3_content_hash(value: str) -> str:
+    """16-hex-char content id from the 64-bit xxh3 hash."""
+    return format(xxhash.xxh3_64_intdigest(value.encode('utf-8')), '016x')
+
+
+# Text watermark content id. WATERMARK_CONTENT_HASH=xxh3 opts into xxh3 when
+# xxhash is installed; keep the default when policy requires a SHA-256 based
+# content hash. Media ids always use SHA-256, the algorithm their C2PA
+# metadata declares. TEXT_HASH_ALGORITHM names a non-default algorithm in the
+# watermark metadata so verifiers know how to recompute the hash; it is None
+# for SHA-256, the algorithm the watermark config documents.
+TEXT_HASH_ALGORITHM = None
+text_content_hash = sha256_content_hash
+if os.getenv("WATERMARK_CONTENT_HASH", "sha256").lower() == "xxh3":
+    if xxhash is not None:
+        TEXT_HASH_ALGORITHM = "xxh3-64"
+        text_content_hash = xxh3_content_hash
+    else:
+        logger.warning("WATERMARK_CONTENT_HASH=xxh3 but xxhash is not installed; using SHA-256")
+
+
+def text_watermark_metadata(generator: str, timestamp: str, content_hash: str) -> Dict[str, Any]:
+    """Metadata embedded in a text watermark"""
+    metadata = {
+        "ai_generated": True,
+        "generator": generator,
+        "timestamp": timestamp,
+        "content_hash": content_hash,
+        "compliance": "EU AI Act Article 50(2)",
+        "watermark_version": "1.0"
+    }
+    if TEXT_HASH_ALGORITHM is not None:
+        metadata["hash_algorithm"] = TEXT_HASH_ALGORITHM
+    return metadata
+
+
+def _metadata_json_template(**dumps_options) -> str:
+    """
+    Serialize the fixed watermark metadata shape once, leaving %s slots for
+    the generator, timestamp and content hash.
+    """
+    return json.dumps(text_watermark_metadata("%s", "%s", "%s"), **dumps_options)
+
+
+def make_header_formatter(prefix: str, suffix: str, **dumps_options):
+    """
+    Build the watermark header renderer for one output format. The returned
+    function takes the JSON-escaped generator, the timestamp and the content hash.
+    """
+    # Fold the wrapper into the template so each call is a single % format
+    template = prefix.replace("%", "%%") + _metadata_json_template(**dumps_options) + suffix.replace("%", "%%")
+    
+    def format_header(generator_json: str, timestamp: str, content_hash: str) -> str:
+        return template % (generator_json, timestamp, content_hash)
+    
+    return format_header
+
+
+# Text watermark header renderer for each output format, specialized once
+WATERMARK_HEADER_FORMATTERS = {
+    "html": make_header_formatter("<!-- AI-Generated Content Metadata\n", "\n-->\n", indent=2),
+    "markdown": make_header_formatter("<!-- AI Watermark: ", " -->\n\n"),
+    "plain": make_header_formatter("[AI-WATERMARK:", "]\n\n", separators=(',', ':'))
+}
+
+
+# Fixed guidance lists returned by the deepfake label tools (server.py and
+# DeepfakePlugin)
+IMAGE_PLACEMENT_OPTIONS = (
+    "Top-left corner overlay",
+    "Bottom banner overlay",
+    "Visible watermark across image",
+    "Caption below image"
+)
+IMAGE_IMPLEMENTATION_NOTES = (
+    "Label must be visible without zooming or special tools",
+    "Text size must be legible (minimum 12pt or 5% of image height)",
+    "Background contrast must ensure readability",
+    "Label should persist in downloaded/shared versions"
+)
+VIDEO_PLACEMENT_OPTIONS = (
+    "Persistent overlay in corner throughout video",
+    "Opening title card (3-5 seconds)",
+    "Closing credit with disclosure",
+    "Intermittent overlay every 30 seconds"
+)
+VIDEO_IMPLEMENTATION_NOTES = (
+    "Label must be visible at standard playback resolution",
+    "Text size must be legible (minimum 5% of frame height)",
+    "Use high contrast background for readability",
+    "Label must persist through video editing and re-encoding",
+    "Consider accessibility: include spoken disclosure for audio description"
+)
+AUDIO_DISCLOSURE_METHODS = (
+    "Spoken announcement at beginning of audio",
+    "Written disclosure in audio player interface",
+    "Metadata embedded in audio file",
+    "Text description accompanying audio"
+)
+AUDIO_IMPLEMENTATION_NOTES = (
+    "Spoken disclosure should be clear and at normal speech volume",
+    "Written disclosure must accompany audio in player/platform",
+    "Embed disclosure in audio file metadata (ID3 tags, etc.)",
+    "Consider accessibility: provide written version for deaf users",
+    "Disclosure should be in same language as primary audio content"
+)
+
+# Format-independent implementation_instructions steps of the media
+# watermark tools (server.py and WatermarkingPlugin)
+IMAGE_INSTRUCTION_STEPS = (
+    "2. Add IPTC metadata as fallback",
+    "3. Ensure watermark survives compression and resizing",
+    "4. Verify watermark using C2PA verification tools",
+    "5. Store watermarked version separately from original"
+)
+VIDEO_INSTRUCTION_STEPS = (
+    "2. Apply watermark at frame level for persistence",
+    "3. Embed metadata in video container and frames",
+    "4. Ensure watermark survives re-encoding",
+    "5. Test with multiple video players"
+)
+AUDIO_INSTRUCTION_STEPS = (
+    "2. Add ID3 tags for MP3 or equivalent for other formats",
+    "3. Apply inaudible spectral watermark (18-20kHz range)",
+    "4. Ensure watermark survives format conversion",
+    "5. Test detectability after compression"
+)
@@ -4,10 +4,20 @@ Deepfake Labeling Plugin - Article 50(4) Content Labeling
 Provides consolidated deepfake labeling tools for all content types.
 """
 
-import os
-import json
 from typing import Dict, Any
 from .base import BasePlugin
+from .common import (
+    AUDIO_DISCLOSURE_METHODS,
+    AUDIO_IMPLEMENTATION_NOTES,
+    IMAGE_IMPLEMENTATION_NOTES,
+    IMAGE_PLACEMENT_OPTIONS,
+    VIDEO_IMPLEMENTATION_NOTES,
+    VIDEO_PLACEMENT_OPTIONS
+)
+
+
+# Content types accepted by label_deepfake
+_CONTENT_TYPES = ("text", "image", "video", "audio")
 
 
 class DeepfakePlugin(BasePlugin):
@@ -39,15 +49,25 @@ class DeepfakePlugin(BasePlugin):
             "deepfake-labels://content-labeling": self.get_deepfake_labels_resource
         }
     
+    def initialize(self) -> None:
+        """Load the deepfake labels resource and pre-split the news labels"""
+        self._deepfake_labels = self.load_resource("deepfake_labels.json")
+        
+        # "news" label of each language split around its {editor} placeholder
+        self._news_label_parts = {
+            language: text_labels["news"].partition("{editor}")
+            for language, text_labels in self._deepfake_labels["text"].items()
+        }
+        
+        # Languages reported back when a label lookup misses, per content type
+        self._label_languages = {
+            content_type: tuple(by_language)
+            for content_type, by_language in self._deepfake_labels.items()
+        }
+    
     def get_deepfake_labels_resource(self) -> str:
         """Resource: Deepfake labels"""
-        labels_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 
-            "resources", 
-            "deepfake_labels.json"
-        )
-        with open(labels_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return self.serve_resource("deepfake_labels.json")
     
     def label_deepfake(
         self,
@@ -84,11 +104,10 @@ class DeepfakePlugin(BasePlugin):
             label_deepfake(content_type="text", text_content="Article...", has_human_editor=True)
         """
         # Validate content type
-        valid_types = ["text", "image", "video", "audio"]
-        if content_type not in valid_types:
+        if content_type not in _CONTENT_TYPES:
             return {
                 "error": f"Invalid content_type '{content_type}'",
-                "valid_types": valid_types
+                "valid_types": _CONTENT_TYPES
             }
         
         # Route to appropriate handler
@@ -116,31 +135,20 @@ class DeepfakePlugin(BasePlugin):
                 "usage": "Provide the actual text to be labeled"
             }
         
-        labels_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 
-            "resources", 
-            "deepfake_labels.json"
-        )
-        
-        with open(labels_path, 'r', encoding='utf-8') as f:
-            labels = json.load(f)
-        
-        # Get the appropriate label
-        try:
-            if has_human_editor and editor_name:
-                label_template = labels["text"][language]["news"]
-                disclosure = label_template.replace("{editor}", editor_name)
-            elif has_human_editor:
-                label_template = labels["text"][language]["news"]
-                disclosure = label_template.replace("{editor}", "editorial team")
-            else:
-                disclosure = labels["text"][language]["news_no_editor"]
-        except KeyError:
+        text_labels = self._deepfake_labels["text"].get(language)
+        if text_labels is None:
             return {
                 "error": f"Labels not found for language '{language}'",
-                "available_languages": list(labels["text"].keys())
+                "available_languages": self._label_languages["text"]
             }
         
+        # Get the appropriate label
+        if has_human_editor:
+            head, placeholder, tail = self._news_label_parts[language]
+            disclosure = head + (editor_name or "editorial team") + tail if placeholder else head
+        else:
+            disclosure = text_labels["news_no_editor"]
+        
         # Add disclosure at the beginning
         labeled_text = f"[{disclosure}]\n\n{text_content}"
         
@@ -172,38 +180,22 @@ class DeepfakePlugin(BasePlugin):
         language: str
     ) -> Dict[str, Any]:
         """Label AI-generated images"""
-        labels_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 
-            "resources", 
-            "deepfake_labels.json"
-        )
-        
-        with open(labels_path, 'r', encoding='utf-8') as f:
-            labels = json.load(f)
-        
-        # Get the appropriate label
-        try:
-            if is_artistic_work or is_satirical:
-                label_text = labels["image"][language]["artistic"]
-                exemption_applies = True
-                exemption_reason = "Artistic work or satire - modified disclosure"
-            else:
-                label_text = labels["image"][language]["standard"]
-                exemption_applies = False
-                exemption_reason = "Standard disclosure required"
-        except KeyError:
+        image_labels = self._deepfake_labels["image"].get(language)
+        if image_labels is None:
             return {
                 "error": f"Labels not found for language '{language}'",
-                "available_languages": list(labels.get("image", {}).keys())
+                "available_languages": self._label_languages["image"]
             }
         
-        # Placement guidance
-        placement_options = [
-            "Top-left corner overlay",
-            "Bottom banner overlay",
-            "Visible watermark across image",
-            "Caption below image"
-        ]
+        # Get the appropriate label
+        if is_artistic_work or is_satirical:
+            label_text = image_labels["artistic"]
+            exemption_applies = True
+            exemption_reason = "Artistic work or satire - modified disclosure"
+        else:
+            label_text = image_labels["standard"]
+            exemption_applies = False
+            exemption_reason = "Standard disclosure required"
         
         return {
             "article": "50(4)",
@@ -213,7 +205,7 @@ class DeepfakePlugin(BasePlugin):
             "image_description": image_description,
             "label_text": label_text,
             "language": language,
-            "placement_options": placement_options,
+            "placement_options": IMAGE_PLACEMENT_OPTIONS,
             "recommended_placement": "Top-left corner overlay with semi-transparent background",
             "visibility_requirement": "Prominent and clearly distinguishable",
             "label_persistence": "Must not be easily removable",
@@ -222,12 +214,7 @@ class DeepfakePlugin(BasePlugin):
             "exemption_applies": exemption_applies,
             "exemption_reason": exemption_reason,
             "compliance_deadline": "2026-08-02",
-            "implementation_notes": [
-                "Label must be visible without zooming or special tools",
-                "Text size must be legible (minimum 12pt or 5% of image height)",
-                "Background contrast must ensure readability",
-                "Label should persist in downloaded/shared versions"
-            ],
+            "implementation_notes": IMAGE_IMPLEMENTATION_NOTES,
             "usage": "Add this label text to the image using one of the placement options"
         }
     
@@ -239,38 +226,22 @@ class DeepfakePlugin(BasePlugin):
         language: str
     ) -> Dict[str, Any]:
         """Label AI-generated videos"""
-        labels_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 
-            "resources", 
-            "deepfake_labels.json"
-        )
-        
-        with open(labels_path, 'r', encoding='utf-8') as f:
-            labels = json.load(f)
-        
-        # Get the appropriate label
-        try:
-            if is_artistic_work or is_satirical:
-                label_text = labels["video"][language]["artistic"]
-                exemption_applies = True
-                exemption_reason = "Artistic work or satire - modified disclosure"
-            else:
-                label_text = labels["video"][language]["standard"]
-                exemption_applies = False
-                exemption_reason = "Standard disclosure required"
-        except KeyError:
+        video_labels = self._deepfake_labels["video"].get(language)
+        if video_labels is None:
             return {
                 "error": f"Labels not found for language '{language}'",
-                "available_languages": list(labels.get("video", {}).keys())
+                "available_languages": self._label_languages["video"]
             }
         
-        # Placement guidance
-        placement_options = [
-            "Persistent overlay in corner throughout video",
-            "Opening title card (3-5 seconds)",
-            "Closing credit with disclosure",
-            "Intermittent overlay every 30 seconds"
-        ]
+        # Get the appropriate label
+        if is_artistic_work or is_satirical:
+            label_text = video_labels["artistic"]
+            exemption_applies = True
+            exemption_reason = "Artistic work or satire - modified disclosure"
+        else:
+            label_text = video_labels["standard"]
+            exemption_applies = False
+            exemption_reason = "Standard disclosure required"
         
         return {
             "article": "50(4)",
@@ -280,7 +251,7 @@ class DeepfakePlugin(BasePlugin):
             "video_description": video_description,
             "label_text": label_text,
             "language": language,
-            "placement_options": placement_options,
+            "placement_options": VIDEO_PLACEMENT_OPTIONS,
             "recommended_placement": "Persistent semi-transparent overlay in top-left corner",
             "visibility_requirement": "Clearly visible and distinguishable throughout playback",
             "label_persistence": "Must persist in all playback formats and cannot be easily removed",
@@ -290,13 +261,7 @@ class DeepfakePlugin(BasePlugin):
             "exemption_applies": exemption_applies,
             "exemption_reason": exemption_reason,
             "compliance_deadline": "2026-08-02",
-            "implementation_notes": [
-                "Label must be visible at standard playback resolution",
-                "Text size must be legible (minimum 5% of frame height)",
-                "Use high contrast background for readability",
-                "Label must persist through video editing and re-encoding",
-                "Consider accessibility: include spoken disclosure for audio description"
-            ],
+            "implementation_notes": VIDEO_IMPLEMENTATION_NOTES,
             "usage": "Add this label to the video using one of the placement options"
         }
     
@@ -307,35 +272,19 @@ class DeepfakePlugin(BasePlugin):
         language: str
     ) -> Dict[str, Any]:
         """Label AI-generated audio"""
-        labels_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 
-            "resources", 
-            "deepfake_labels.json"
-        )
-        
-        with open(labels_path, 'r', encoding='utf-8') as f:
-            labels = json.load(f)
-        
-        # Get labels
-        try:
-            written_label = labels["audio"][language]["standard"]
-            spoken_label = labels["audio"][language]["spoken"]
-            
-            exemption_applies = is_artistic_work
-            exemption_reason = "Artistic work - modified disclosure may apply" if is_artistic_work else "Standard disclosure required"
-        except KeyError:
+        audio_labels = self._deepfake_labels["audio"].get(language)
+        if audio_labels is None:
             return {
                 "error": f"Labels not found for language '{language}'",
-                "available_languages": list(labels.get("audio", {}).keys())
+                "available_languages": self._label_languages["audio"]
             }
         
-        # Disclosure methods
-        disclosure_methods = [
-            "Spoken announcement at beginning of audio",
-            "Written disclosure in audio player interface",
-            "Metadata embedded in audio file",
-            "Text description accompanying audio"
-        ]
+        # Get labels
+        written_label = audio_labels["standard"]
+        spoken_label = audio_labels["spoken"]
+        
+        exemption_applies = is_artistic_work
+        exemption_reason = "Artistic work - modified disclosure may apply" if is_artistic_work else "Standard disclosure required"
         
         return {
             "article": "50(4)",
@@ -346,19 +295,13 @@ class DeepfakePlugin(BasePlugin):
             "written_label": written_label,
             "spoken_label": spoken_label,
             "language": language,
-            "disclosure_methods": disclosure_methods,
+            "disclosure_methods": AUDIO_DISCLOSURE_METHODS,
             "recommended_method": "Spoken announcement at beginning + written metadata",
             "spoken_disclosure_timing": "Beginning of audio (first 3 seconds)",
             "is_artistic_work": is_artistic_work,
             "exemption_applies": exemption_applies,
             "exemption_reason": exemption_reason,
             "compliance_deadline": "2026-08-02",
-            "implementation_notes": [
-                "Spoken disclosure should be clear and at normal speech volume",
-                "Written disclosure must accompany audio in player/platform",
-                "Embed disclosure in audio file metadata (ID3 tags, etc.)",
-                "Consider accessibility: provide written version for deaf users",
-                "Disclosure should be in same language as primary audio content"
-            ],
+            "implementation_notes": AUDIO_IMPLEMENTATION_NOTES,
             "usage": "Add spoken disclosure at audio start and include written label in metadata/description"
         }
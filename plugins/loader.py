@@ -12,6 +12,10 @@ from typing import List
 from .base import BasePlugin, PluginRegistry
 
 
+# Default plugins directory (the directory containing this file)
+PLUGINS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
 def discover_plugins(plugins_dir: str = None) -> List[type]:
     """
     Discover all plugin classes in the plugins directory.
@@ -24,15 +28,15 @@ def discover_plugins(plugins_dir: str = None) -> List[type]:
     """
     if plugins_dir is None:
         # Default to plugins directory relative to this file
-        plugins_dir = os.path.dirname(os.path.abspath(__file__))
+        plugins_dir = PLUGINS_DIR
     
     plugin_classes = []
     plugins_path = Path(plugins_dir)
     
     # Iterate through all Python files in the plugins directory
     for file_path in plugins_path.glob("*.py"):
-        # Skip __init__.py, base.py, and loader.py
-        if file_path.stem in ["__init__", "base", "loader"]:
+        # Skip __init__.py, base.py, common.py and loader.py
+        if file_path.stem in ["__init__", "base", "common", "loader"]:
             continue
         
         try:
@@ -85,7 +89,7 @@ def load_plugin_by_name(registry: PluginRegistry, plugin_name: str, plugins_dir:
         plugins_dir: Path to the plugins directory. If None, uses default.
     """
     if plugins_dir is None:
-        plugins_dir = os.path.dirname(os.path.abspath(__file__))
+        plugins_dir = PLUGINS_DIR
     
     try:
         # Import the module
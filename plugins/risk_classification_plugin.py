@@ -4,12 +4,14 @@ Risk Classification Plugin - Articles 5, 6, and Annex III
 Provides risk classification and prohibited practices checking.
 """
 
-import os
-import json
 from typing import Dict, Any
 from .base import BasePlugin
 
 
+# use_case values (lowercased) classified as Annex III point 4(a) employment
+_EMPLOYMENT_USE_CASES = frozenset({"employment", "hiring", "hr", "recruitment"})
+
+
 class RiskClassificationPlugin(BasePlugin):
     """
     Plugin for EU AI Act risk classification and prohibited practices.
@@ -38,13 +40,7 @@ class RiskClassificationPlugin(BasePlugin):
     
     def get_article50_rules_resource(self) -> str:
         """Resource: Article 50 rules"""
-        rules_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 
-            "resources", 
-            "article50_rules.json"
-        )
-        with open(rules_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return self.serve_resource("article50_rules.json")
     
     def classify_ai_system_risk(
         self,
@@ -131,7 +127,7 @@ class RiskClassificationPlugin(BasePlugin):
                 "article_ref": "Article 6(2)"
             })
         
-        if use_case.lower() in ["employment", "hiring", "hr", "recruitment"]:
+        if use_case.lower() in _EMPLOYMENT_USE_CASES:
             high_risk_checks.append({
                 "reason": "AI system for employment, recruitment, or HR decisions",
                 "annex_point": "Annex III point 4(a)",
@@ -4,10 +4,17 @@ Role Determination Plugin - Article 3
 Provides role determination for EU AI Act compliance.
 """
 
+import re
 from typing import Dict, Any
 from .base import BasePlugin
 
 
+# Locations treated as EU-based: exact names, and member states matched
+# anywhere in the lowercased location with one compiled alternation
+_EU_LOCATIONS = frozenset({"eu", "european union"})
+_EU_COUNTRY_RE = re.compile("germany|france|spain|italy|netherlands|belgium|austria|ireland|portugal|greece")
+
+
 class RoleDeterminationPlugin(BasePlugin):
     """
     Plugin for EU AI Act role determination.
@@ -68,11 +75,8 @@ class RoleDeterminationPlugin(BasePlugin):
         
         roles_identified = []
         role_details = {}
-        is_in_eu = company_location.lower() in ["eu", "european union"] or any(
-            country in company_location.lower() 
-            for country in ["germany", "france", "spain", "italy", "netherlands", 
-                           "belgium", "austria", "ireland", "portugal", "greece"]
-        )
+        location = company_location.lower()
+        is_in_eu = location in _EU_LOCATIONS or _EU_COUNTRY_RE.search(location) is not None
         
         # Step 1: Check if PROVIDER
         is_provider = (
@@ -4,12 +4,15 @@ Transparency Plugin - Article 50 Disclosures
 Provides consolidated disclosure tools for AI interaction and emotion recognition.
 """
 
-import os
-import json
+from types import MappingProxyType
 from typing import Dict, Any
 from .base import BasePlugin
 
 
+# Disclosure types accepted by get_disclosure
+_DISCLOSURE_TYPES = ("ai_interaction", "emotion_recognition")
+
+
 class TransparencyPlugin(BasePlugin):
     """
     Plugin for EU AI Act Article 50 transparency disclosures.
@@ -38,15 +41,33 @@ class TransparencyPlugin(BasePlugin):
             "disclosure-templates://ai-interaction-and-emotion": self.get_disclosure_templates_resource
         }
     
+    def initialize(self) -> None:
+        """Read the disclosure templates and deepfake labels once and build every disclosure response"""
+        self._disclosure_templates = self.load_resource("disclosure_templates.json")
+        
+        # Complete responses keyed by (disclosure_type, language, style),
+        # read-only so the shared copies cannot be altered
+        self._disclosure_responses = {
+            (disclosure_type, language, style): MappingProxyType(
+                self._build_disclosure(disclosure_type, language, style, disclosure_text)
+            )
+            for disclosure_type in _DISCLOSURE_TYPES
+            for language, styles in self._disclosure_templates[disclosure_type].items()
+            for style, disclosure_text in styles.items()
+        }
+        
+        # Parsed deepfake labels (shared with DeepfakePlugin), and the
+        # get_deepfake_label_templates result for every language that has labels
+        self._deepfake_labels = self.load_resource("deepfake_labels.json")
+        self._label_templates = {
+            language: self._build_label_templates(language)
+            for by_language in self._deepfake_labels.values()
+            for language in by_language
+        }
+    
     def get_disclosure_templates_resource(self) -> str:
         """Resource: Pre-written disclosure templates"""
-        template_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 
-            "resources", 
-            "disclosure_templates.json"
-        )
-        with open(template_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return self.serve_resource("disclosure_templates.json")
     
     def get_disclosure(
         self, 
@@ -74,33 +95,30 @@ class TransparencyPlugin(BasePlugin):
             get_disclosure(disclosure_type="ai_interaction", language="en", style="simple")
             get_disclosure(disclosure_type="emotion_recognition", language="fr", style="detailed")
         """
-        template_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 
-            "resources", 
-            "disclosure_templates.json"
-        )
-        
-        with open(template_path, 'r', encoding='utf-8') as f:
-            templates = json.load(f)
+        templates = self._disclosure_templates
         
         # Validate disclosure type
-        if disclosure_type not in ["ai_interaction", "emotion_recognition"]:
+        if disclosure_type not in _DISCLOSURE_TYPES:
             return {
                 "error": f"Invalid disclosure_type '{disclosure_type}'",
-                "valid_types": ["ai_interaction", "emotion_recognition"]
+                "valid_types": _DISCLOSURE_TYPES
             }
         
         # Get the requested disclosure
-        try:
-            disclosure_text = templates[disclosure_type][language][style]
-        except KeyError:
+        response = self._disclosure_responses.get((disclosure_type, language, style))
+        if response is None:
             return {
                 "error": f"Disclosure not found for type '{disclosure_type}', language '{language}', style '{style}'",
                 "available_languages": list(templates.get(disclosure_type, {}).keys()),
                 "available_styles": list(templates.get(disclosure_type, {}).get(language, {}).keys()) if language in templates.get(disclosure_type, {}) else []
             }
         
-        # Build response based on type
+        # Copy so callers cannot alter the shared response
+        return response.copy()
+    
+    @staticmethod
+    def _build_disclosure(disclosure_type: str, language: str, style: str, disclosure_text: str) -> Dict[str, Any]:
+        """Build the get_disclosure response for one template"""
         if disclosure_type == "ai_interaction":
             return {
                 "article": "50(1)",
@@ -141,14 +159,21 @@ class TransparencyPlugin(BasePlugin):
         Example:
             get_deepfake_label_templates(language="en")
         """
-        labels_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 
-            "resources", 
-            "deepfake_labels.json"
-        )
-        
-        with open(labels_path, 'r', encoding='utf-8') as f:
-            all_labels = json.load(f)
+        result = self._label_templates.get(language)
+        if result is None:
+            result = self._build_label_templates(language)
+        
+        # Copy so callers cannot alter the cached labels
+        response = result.copy()
+        response["content_types"] = {
+            content_type: labels.copy()
+            for content_type, labels in result["content_types"].items()
+        }
+        return response
+    
+    def _build_label_templates(self, language: str) -> Dict[str, Any]:
+        """Build the get_deepfake_label_templates result for one language"""
+        all_labels = self._deepfake_labels
         
         # Filter by language if available
         result = {
@@ -156,18 +181,18 @@ class TransparencyPlugin(BasePlugin):
             "content_types": {}
         }
         
-        for content_type in ["text", "image", "video", "audio"]:
+        for content_type in ("text", "image", "video", "audio"):
             if content_type in all_labels:
                 if language in all_labels[content_type]:
                     result["content_types"][content_type] = all_labels[content_type][language]
                 else:
                     result["content_types"][content_type] = {
                         "error": f"Language '{language}' not available for {content_type}",
-                        "available_languages": list(all_labels[content_type].keys())
+                        "available_languages": tuple(all_labels[content_type])
                     }
         
         result["article"] = "50(2) and 50(4)"
         result["purpose"] = "Labels for AI-generated and manipulated content"
-        result["available_languages"] = ["en", "es", "fr", "de"]
+        result["available_languages"] = ("en", "es", "fr", "de")
         
         return result
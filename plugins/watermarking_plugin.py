@@ -4,12 +4,28 @@ Watermarking Plugin - Article 50(2) Content Watermarking
 Provides consolidated watermarking tools for all content types.
 """
 
-import os
-import json
-import hashlib
-from datetime import datetime, timezone
+from json.encoder import encode_basestring_ascii
 from typing import Dict, Any
 from .base import BasePlugin
+from .common import (
+    AUDIO_INSTRUCTION_STEPS,
+    IMAGE_INSTRUCTION_STEPS,
+    VIDEO_INSTRUCTION_STEPS,
+    WATERMARK_HEADER_FORMATTERS,
+    sha256_content_hash,
+    text_content_hash,
+    text_watermark_metadata,
+    utc_timestamp
+)
+
+# Default format_type for each content type (also the set of valid types)
+_DEFAULT_FORMATS = {
+    "text": "plain",
+    "image": "png",
+    "video": "mp4",
+    "audio": "mp3"
+}
+_CONTENT_TYPES = tuple(_DEFAULT_FORMATS)
 
 
 class WatermarkingPlugin(BasePlugin):
@@ -43,13 +59,7 @@ class WatermarkingPlugin(BasePlugin):
     
     def get_watermark_config_resource(self) -> str:
         """Resource: Watermarking technical standards"""
-        config_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 
-            "resources", 
-            "watermark_config.json"
-        )
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return self.serve_resource("watermark_config.json")
     
     def watermark_content(
         self,
@@ -84,22 +94,16 @@ class WatermarkingPlugin(BasePlugin):
             watermark_content(content_type="text", text_content="Article text...", generator="GPT-4")
         """
         # Validate content type
-        valid_types = ["text", "image", "video", "audio"]
-        if content_type not in valid_types:
+        default_format = _DEFAULT_FORMATS.get(content_type)
+        if default_format is None:
             return {
                 "error": f"Invalid content_type '{content_type}'",
-                "valid_types": valid_types
+                "valid_types": _CONTENT_TYPES
             }
         
         # Set default format_type based on content_type
         if format_type is None:
-            defaults = {
-                "text": "plain",
-                "image": "png",
-                "video": "mp4",
-                "audio": "mp3"
-            }
-            format_type = defaults[content_type]
+            format_type = default_format
         
         # Route to appropriate handler
         if content_type == "text":
@@ -126,32 +130,18 @@ class WatermarkingPlugin(BasePlugin):
             }
         
         # Generate content hash
-        content_hash = hashlib.sha256(text_content.encode('utf-8')).hexdigest()[:16]
-        timestamp = datetime.now(timezone.utc).isoformat()
+        content_hash = text_content_hash(text_content)
+        timestamp = utc_timestamp()
         
         # Create metadata
-        metadata = {
-            "ai_generated": True,
-            "generator": generator,
-            "timestamp": timestamp,
-            "content_hash": content_hash,
-            "compliance": "EU AI Act Article 50(2)",
-            "watermark_version": "1.0"
-        }
+        metadata = text_watermark_metadata(generator, timestamp, content_hash)
         
-        # Format the watermarked text
-        if format_type == "html":
-            watermarked_text = f'''<!-- AI-Generated Content Metadata
-{json.dumps(metadata, indent=2)}
--->
-{text_content}'''
-        elif format_type == "markdown":
-            watermarked_text = f'''<!-- AI Watermark: {json.dumps(metadata)} -->
-
-{text_content}'''
-        else:  # plain text
-            metadata_str = json.dumps(metadata, separators=(',', ':'))
-            watermarked_text = f"[AI-WATERMARK:{metadata_str}]\n\n{text_content}"
+        # Render the header for the requested format (unknown formats fall back
+        # to plain); only the generator needs JSON escaping, done with the
+        # same C string escaper json.dumps uses
+        format_header = WATERMARK_HEADER_FORMATTERS.get(format_type, WATERMARK_HEADER_FORMATTERS["plain"])
+        header = format_header(encode_basestring_ascii(generator)[1:-1], timestamp, content_hash)
+        watermarked_text = header + text_content
         
         return {
             "article": "50(2)",
@@ -176,8 +166,8 @@ class WatermarkingPlugin(BasePlugin):
         format_type: str
     ) -> Dict[str, Any]:
         """Generate watermarking metadata for images"""
-        timestamp = datetime.now(timezone.utc).isoformat()
-        content_hash = hashlib.sha256(image_description.encode()).hexdigest()[:16]
+        timestamp = utc_timestamp()
+        content_hash = sha256_content_hash(image_description)
         
         # C2PA metadata structure
         c2pa_metadata = {
@@ -220,13 +210,10 @@ class WatermarkingPlugin(BasePlugin):
             "machine_readable": True,
             "detectable": True,
             "compliance_deadline": "2026-08-02",
-            "implementation_instructions": [
+            "implementation_instructions": (
                 f"1. Use C2PA library to embed metadata in {format_type} file",
-                "2. Add IPTC metadata as fallback",
-                "3. Ensure watermark survives compression and resizing",
-                "4. Verify watermark using C2PA verification tools",
-                "5. Store watermarked version separately from original"
-            ],
+                *IMAGE_INSTRUCTION_STEPS
+            ),
             "verification_url": "https://verify.contentauthenticity.org/",
             "usage": "Use provided metadata to watermark the image file using C2PA-compliant tools"
         }
@@ -238,8 +225,8 @@ class WatermarkingPlugin(BasePlugin):
         format_type: str
     ) -> Dict[str, Any]:
         """Generate watermarking metadata for videos"""
-        timestamp = datetime.now(timezone.utc).isoformat()
-        content_hash = hashlib.sha256(video_description.encode()).hexdigest()[:16]
+        timestamp = utc_timestamp()
+        content_hash = sha256_content_hash(video_description)
         
         c2pa_metadata = {
             "claim_generator": "EU AI Act Compliance MCP Server",
@@ -272,13 +259,10 @@ class WatermarkingPlugin(BasePlugin):
             "machine_readable": True,
             "detectable": True,
             "compliance_deadline": "2026-08-02",
-            "implementation_instructions": [
+            "implementation_instructions": (
                 f"1. Use C2PA video library to embed metadata in {format_type} file",
-                "2. Apply watermark at frame level for persistence",
-                "3. Embed metadata in video container and frames",
-                "4. Ensure watermark survives re-encoding",
-                "5. Test with multiple video players"
-            ],
+                *VIDEO_INSTRUCTION_STEPS
+            ),
             "verification_url": "https://verify.contentauthenticity.org/",
             "usage": "Use provided metadata to watermark the video file using C2PA-compliant tools"
         }
@@ -290,8 +274,8 @@ class WatermarkingPlugin(BasePlugin):
         format_type: str
     ) -> Dict[str, Any]:
         """Generate watermarking metadata for audio"""
-        timestamp = datetime.now(timezone.utc).isoformat()
-        content_hash = hashlib.sha256(audio_description.encode()).hexdigest()[:16]
+        timestamp = utc_timestamp()
+        content_hash = sha256_content_hash(audio_description)
         
         c2pa_metadata = {
             "claim_generator": "EU AI Act Compliance MCP Server",
@@ -333,12 +317,9 @@ class WatermarkingPlugin(BasePlugin):
             "detectable": True,
             "inaudible": True,
             "compliance_deadline": "2026-08-02",
-            "implementation_instructions": [
+            "implementation_instructions": (
                 f"1. Embed C2PA metadata in {format_type} file",
-                "2. Add ID3 tags for MP3 or equivalent for other formats",
-                "3. Apply inaudible spectral watermark (18-20kHz range)",
-                "4. Ensure watermark survives format conversion",
-                "5. Test detectability after compression"
-            ],
+                *AUDIO_INSTRUCTION_STEPS
+            ),
             "usage": "Use provided metadata to watermark the audio file"
         }
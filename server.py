@@ -6,11 +6,36 @@ This MCP server provides tools and resources for EU AI Act Article 50 compliance
 including transparency obligations for AI systems.
 """
 
+from __future__ import annotations
+
 import os
+import re
 import json
-from typing import Dict, Any, List
+import functools
+from itertools import compress
+from json.encoder import encode_basestring_ascii
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional
 from mcp.server.fastmcp import FastMCP
 from dotenv import load_dotenv
+from plugins.common import (
+    AUDIO_DISCLOSURE_METHODS,
+    AUDIO_IMPLEMENTATION_NOTES,
+    AUDIO_INSTRUCTION_STEPS,
+    IMAGE_IMPLEMENTATION_NOTES,
+    IMAGE_INSTRUCTION_STEPS,
+    IMAGE_PLACEMENT_OPTIONS,
+    VIDEO_IMPLEMENTATION_NOTES,
+    VIDEO_INSTRUCTION_STEPS,
+    VIDEO_PLACEMENT_OPTIONS,
+    WATERMARK_HEADER_FORMATTERS,
+    resource_data,
+    resource_text,
+    sha256_content_hash,
+    text_content_hash,
+    text_watermark_metadata,
+    utc_timestamp
+)
 
 # Load environment variables (if needed for future extensions)
 load_dotenv()
@@ -19,11 +44,52 @@ load_dotenv()
 mcp = FastMCP("EU_AI_ACT_MCP")
 
 
+# ============================================================================
+# RESOURCE CACHE - Static data files loaded once at import
+# ============================================================================
+
+# Resource files served by the resource endpoints
+_RESOURCE_FILES = (
+    "disclosure_templates.json",
+    "deepfake_labels.json",
+    "article50_rules.json",
+    "watermark_config.json"
+)
+
+# Parsed JSON of every resource file, keyed by file name. Loading them all at
+# import stops the server on a malformed file instead of reaching clients.
+# The endpoints serve resource_text(), shared with the plugin server.
+_RESOURCE_DATA = {filename: resource_data(filename) for filename in _RESOURCE_FILES}
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert parsed JSON into read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Parsed templates shared by the tools. Frozen so shared references cannot
+# be altered. FastMCP cannot serialize mappingproxy, so tools return copy()
+# of these and of the read-only responses built below; a proxy's copy()
+# copies the underlying dict in one C call, unlike dict() or **.
+_DISCLOSURE_TEMPLATES = _freeze(_RESOURCE_DATA["disclosure_templates.json"])
+_DEEPFAKE_LABELS = _freeze(_RESOURCE_DATA["deepfake_labels.json"])
+
+# Languages reported back when a label lookup misses, per content type
+_LABEL_LANGUAGES = {
+    content_type: tuple(by_language)
+    for content_type, by_language in _DEEPFAKE_LABELS.items()
+}
+
+
 # ============================================================================
 # RESOURCES - Data files that agents can read
 # ============================================================================
 
-@mcp.resource("disclosure-templates://ai-interaction-and-emotion")
+@mcp.resource("disclosure-templates://ai-interaction-and-emotion", mime_type="application/json")
 def get_disclosure_templates() -> str:
     """
     Provides pre-written disclosure text templates for EU AI Act Article 50 compliance.
@@ -34,12 +100,10 @@ def get_disclosure_templates() -> str:
     
     Available in multiple languages: en, es, fr, de, it
     """
-    template_path = os.path.join(os.path.dirname(__file__), "resources", "disclosure_templates.json")
-    with open(template_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    return resource_text("disclosure_templates.json")
 
 
-@mcp.resource("deepfake-labels://content-labeling")
+@mcp.resource("deepfake-labels://content-labeling", mime_type="application/json")
 def get_deepfake_labels() -> str:
     """
     Provides pre-written deepfake and AI-generated content labels for EU AI Act Article 50(4) compliance.
@@ -52,12 +116,10 @@ def get_deepfake_labels() -> str:
     
     Available in multiple languages: en, es, fr, de
     """
-    labels_path = os.path.join(os.path.dirname(__file__), "resources", "deepfake_labels.json")
-    with open(labels_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    return resource_text("deepfake_labels.json")
 
 
-@mcp.resource("article50-rules://official-text")
+@mcp.resource("article50-rules://official-text", mime_type="application/json")
 def get_article50_rules() -> str:
     """
     Provides the official EU AI Act Article 50 rules and requirements.
@@ -73,12 +135,10 @@ def get_article50_rules() -> str:
     
     Use this resource to understand which obligations apply to your AI system.
     """
-    rules_path = os.path.join(os.path.dirname(__file__), "resources", "article50_rules.json")
-    with open(rules_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    return resource_text("article50_rules.json")
 
 
-@mcp.resource("watermark-config://technical-standards")
+@mcp.resource("watermark-config://technical-standards", mime_type="application/json")
 def get_watermark_config() -> str:
     """
     Provides watermarking configuration and technical standards for Article 50(2).
@@ -94,15 +154,101 @@ def get_watermark_config() -> str:
     Use this resource to understand how to properly watermark AI-generated content
     with machine-readable, detectable metadata that complies with Article 50(2).
     """
-    config_path = os.path.join(os.path.dirname(__file__), "resources", "watermark_config.json")
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    return resource_text("watermark_config.json")
+
+
+# Resource URI -> backing file, for the version tags below
+_RESOURCE_URIS = {
+    "disclosure-templates://ai-interaction-and-emotion": "disclosure_templates.json",
+    "deepfake-labels://content-labeling": "deepfake_labels.json",
+    "article50-rules://official-text": "article50_rules.json",
+    "watermark-config://technical-standards": "watermark_config.json"
+}
+
+
+# 16-hex-char SHA-256 tag of a served resource body. Memoized on the cached
+# string, so a tag is only recomputed when the body itself changes.
+_resource_etag = functools.lru_cache(maxsize=16)(sha256_content_hash)
+
+
+@mcp.resource("resource-versions://etags", mime_type="application/json")
+def get_resource_versions() -> str:
+    """
+    Provides a version tag for each of the resources above, keyed by URI.
+    
+    A tag changes only when the resource content changes, so clients that
+    keep a copy of a resource can skip re-reading it while its tag matches.
+    """
+    return json.dumps(
+        {uri: _resource_etag(resource_text(filename)) for uri, filename in _RESOURCE_URIS.items()},
+        separators=(',', ':')
+    )
 
 
 # ============================================================================
 # TOOLS - Article 50 Compliance Tools
 # ============================================================================
 
+# Complete disclosure responses for every (language, style) pair, built once
+_AI_INTERACTION_RESPONSES = MappingProxyType({
+    (language, style): MappingProxyType({
+        "article": "50(1)",
+        "obligation": "AI Interaction Transparency",
+        "language": language,
+        "style": style,
+        "disclosure": disclosure_text,
+        "usage": "Display this text to users before or during AI interaction",
+        "compliance_deadline": "2026-08-02"
+    })
+    for language, styles in _DISCLOSURE_TEMPLATES["ai_interaction"].items()
+    for style, disclosure_text in styles.items()
+})
+
+_EMOTION_RECOGNITION_RESPONSES = MappingProxyType({
+    (language, style): MappingProxyType({
+        "article": "50(3)",
+        "obligation": "Emotion Recognition Transparency",
+        "language": language,
+        "style": style,
+        "disclosure": disclosure_text,
+        "usage": "Display this text to users before activating emotion recognition",
+        "gdpr_compliance": "Ensure user consent is obtained",
+        "compliance_deadline": "2026-08-02"
+    })
+    for language, styles in _DISCLOSURE_TEMPLATES["emotion_recognition"].items()
+    for style, disclosure_text in styles.items()
+})
+
+# Valid choices reported back when a disclosure lookup misses; a miss only
+# adds its error message to these shared fields
+_AI_INTERACTION_ERROR_FIELDS = MappingProxyType({
+    "available_languages": tuple(_DISCLOSURE_TEMPLATES["ai_interaction"]),
+    "available_styles": ("simple", "detailed", "voice")
+})
+_EMOTION_RECOGNITION_ERROR_FIELDS = MappingProxyType({
+    "available_languages": tuple(_DISCLOSURE_TEMPLATES["emotion_recognition"]),
+    "available_styles": ("simple", "detailed", "privacy_notice")
+})
+
+
+def _disclosure_response(
+    responses: Dict[tuple, Any],
+    error_fields: Dict[str, Any],
+    language: str,
+    style: str
+) -> Dict[str, Any]:
+    """Shared body of the disclosure tools: look up a prebuilt response or report valid choices."""
+    response = responses.get((language, style))
+    if response is None:
+        return {
+            "error": f"Disclosure not found for language '{language}' and style '{style}'",
+            **error_fields
+        }
+    
+    # Copy so callers cannot alter the shared response
+    return response.copy()
+
+
 @mcp.tool()
 def get_ai_interaction_disclosure(language: str = "en", style: str = "simple") -> Dict[str, Any]:
     """
@@ -122,30 +268,7 @@ def get_ai_interaction_disclosure(language: str = "en", style: str = "simple") -
         get_ai_interaction_disclosure(language="en", style="simple")
         Returns: {"disclosure": "You are chatting with an AI assistant.", ...}
     """
-    template_path = os.path.join(os.path.dirname(__file__), "resources", "disclosure_templates.json")
-    
-    with open(template_path, 'r', encoding='utf-8') as f:
-        templates = json.load(f)
-    
-    # Get the requested disclosure
-    try:
-        disclosure_text = templates["ai_interaction"][language][style]
-    except KeyError:
-        return {
-            "error": f"Disclosure not found for language '{language}' and style '{style}'",
-            "available_languages": list(templates["ai_interaction"].keys()),
-            "available_styles": ["simple", "detailed", "voice"]
-        }
-    
-    return {
-        "article": "50(1)",
-        "obligation": "AI Interaction Transparency",
-        "language": language,
-        "style": style,
-        "disclosure": disclosure_text,
-        "usage": "Display this text to users before or during AI interaction",
-        "compliance_deadline": "2026-08-02"
-    }
+    return _disclosure_response(_AI_INTERACTION_RESPONSES, _AI_INTERACTION_ERROR_FIELDS, language, style)
 
 
 @mcp.tool()
@@ -166,31 +289,35 @@ def get_emotion_recognition_disclosure(language: str = "en", style: str = "simpl
     Example:
         get_emotion_recognition_disclosure(language="en", style="detailed")
     """
-    template_path = os.path.join(os.path.dirname(__file__), "resources", "disclosure_templates.json")
-    
-    with open(template_path, 'r', encoding='utf-8') as f:
-        templates = json.load(f)
-    
-    # Get the requested disclosure
-    try:
-        disclosure_text = templates["emotion_recognition"][language][style]
-    except KeyError:
-        return {
-            "error": f"Disclosure not found for language '{language}' and style '{style}'",
-            "available_languages": list(templates["emotion_recognition"].keys()),
-            "available_styles": ["simple", "detailed", "privacy_notice"]
-        }
+    return _disclosure_response(_EMOTION_RECOGNITION_RESPONSES, _EMOTION_RECOGNITION_ERROR_FIELDS, language, style)
+
+
+@functools.lru_cache(maxsize=16)
+def _deepfake_templates_for(language: str) -> Dict[str, Any]:
+    """Build the get_deepfake_label_templates result for one language."""
+    all_labels = _DEEPFAKE_LABELS
     
-    return {
-        "article": "50(3)",
-        "obligation": "Emotion Recognition Transparency",
+    # Filter by language if available
+    result = {
         "language": language,
-        "style": style,
-        "disclosure": disclosure_text,
-        "usage": "Display this text to users before activating emotion recognition",
-        "gdpr_compliance": "Ensure user consent is obtained",
-        "compliance_deadline": "2026-08-02"
+        "content_types": {}
     }
+    
+    for content_type in ["text", "image", "video", "audio"]:
+        if content_type in all_labels:
+            if language in all_labels[content_type]:
+                result["content_types"][content_type] = all_labels[content_type][language]
+            else:
+                result["content_types"][content_type] = {
+                    "error": f"Language '{language}' not available for {content_type}",
+                    "available_languages": tuple(all_labels[content_type])
+                }
+    
+    result["article"] = "50(2) and 50(4)"
+    result["purpose"] = "Labels for AI-generated and manipulated content"
+    result["available_languages"] = ("en", "es", "fr", "de")
+    
+    return result
 
 
 @mcp.tool()
@@ -211,32 +338,23 @@ def get_deepfake_label_templates(language: str = "en") -> Dict[str, Any]:
         get_deepfake_label_templates(language="en")
         Returns all labels for English
     """
-    labels_path = os.path.join(os.path.dirname(__file__), "resources", "deepfake_labels.json")
-    
-    with open(labels_path, 'r', encoding='utf-8') as f:
-        all_labels = json.load(f)
+    result = _deepfake_templates_for(language)
     
-    # Filter by language if available
-    result = {
-        "language": language,
-        "content_types": {}
+    # Copy so callers cannot alter the cached labels
+    return {
+        **result,
+        "content_types": {
+            content_type: labels.copy()
+            for content_type, labels in result["content_types"].items()
+        }
     }
-    
-    for content_type in ["text", "image", "video", "audio"]:
-        if content_type in all_labels:
-            if language in all_labels[content_type]:
-                result["content_types"][content_type] = all_labels[content_type][language]
-            else:
-                result["content_types"][content_type] = {
-                    "error": f"Language '{language}' not available for {content_type}",
-                    "available_languages": list(all_labels[content_type].keys())
-                }
-    
-    result["article"] = "50(2) and 50(4)"
-    result["purpose"] = "Labels for AI-generated and manipulated content"
-    result["available_languages"] = ["en", "es", "fr", "de"]
-    
-    return result
+
+
+# "news" label of each language split around its {editor} placeholder
+_NEWS_LABEL_PARTS = {
+    language: labels["news"].partition("{editor}")
+    for language, labels in _DEEPFAKE_LABELS["text"].items()
+}
 
 
 @mcp.tool()
@@ -269,29 +387,23 @@ def label_news_text(
             language="en"
         )
     """
-    labels_path = os.path.join(os.path.dirname(__file__), "resources", "deepfake_labels.json")
-    
-    with open(labels_path, 'r', encoding='utf-8') as f:
-        labels = json.load(f)
-    
-    # Get the appropriate label based on editor status
-    try:
-        if has_human_editor and editor_name:
-            label_template = labels["text"][language]["news"]
-            disclosure = label_template.replace("{editor}", editor_name)
-        elif has_human_editor:
-            label_template = labels["text"][language]["news"]
-            disclosure = label_template.replace("{editor}", "editorial team")
-        else:
-            disclosure = labels["text"][language]["news_no_editor"]
-    except KeyError:
+    # Validate the language up front instead of catching KeyError
+    if language not in _NEWS_LABEL_PARTS:
         return {
             "error": f"Labels not found for language '{language}'",
-            "available_languages": list(labels["text"].keys())
+            "available_languages": _LABEL_LANGUAGES["text"]
         }
     
+    # Get the appropriate label based on editor status
+    if has_human_editor:
+        head, placeholder, tail = _NEWS_LABEL_PARTS[language]
+        disclosure = head + (editor_name or "editorial team") + tail if placeholder else head
+    else:
+        disclosure = _DEEPFAKE_LABELS["text"][language]["news_no_editor"]
+    
     # Add disclosure at the beginning of the text
-    labeled_text = f"[{disclosure}]\n\n{text_content}"
+    header = f"[{disclosure}]\n\n"
+    original_length = len(text_content)
     
     # Determine if exemption applies
     exemption_applies = has_human_editor
@@ -301,10 +413,10 @@ def label_news_text(
         "article": "50(4)",
         "obligation": "AI-Generated Content Labeling (Text/News)",
         "language": language,
-        "labeled_text": labeled_text,
+        "labeled_text": header + text_content,
         "disclosure": disclosure,
-        "original_length": len(text_content),
-        "labeled_length": len(labeled_text),
+        "original_length": original_length,
+        "labeled_length": len(header) + original_length,
         "has_human_editor": has_human_editor,
         "exemption_applies": exemption_applies,
         "exemption_reason": exemption_reason,
@@ -313,11 +425,79 @@ def label_news_text(
     }
 
 
+def _batch_item_error(item: Any, required: tuple, field_types: Dict[str, type]) -> Optional[str]:
+    """
+    Validate one item of a batch tool call. Returns the error message for the
+    item, or None when it can be passed on to the single-item tool; checking
+    here keeps one malformed item from failing the whole batch.
+    """
+    if not isinstance(item, dict):
+        return "Item must be an object"
+    for field in required:
+        if field not in item:
+            return f"Missing required field '{field}'"
+    for field, expected_type in field_types.items():
+        if field in item and not isinstance(item[field], expected_type):
+            return f"Field '{field}' must be of type {expected_type.__name__}"
+    return None
+
+
+# Expected type of each label_news_texts item field
+_NEWS_BATCH_FIELD_TYPES = {
+    "text_content": str,
+    "has_human_editor": bool,
+    "editor_name": str,
+    "language": str
+}
+
+
+@mcp.tool()
+def label_news_texts(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Label a batch of news articles in one call (EU AI Act Article 50(4)).
+    
+    Each item takes the same fields as label_news_text: text_content (required),
+    has_human_editor, editor_name and language. Results are returned in order.
+    
+    Args:
+        items: List of articles to label
+        
+    Returns:
+        List of label_news_text results, one per item
+        
+    Example:
+        label_news_texts(items=[
+            {"text_content": "AI generated article...", "language": "en"},
+            {"text_content": "Artículo generado...", "has_human_editor": True, "editor_name": "Ana", "language": "es"}
+        ])
+    """
+    results = []
+    for item in items:
+        error = _batch_item_error(item, ("text_content",), _NEWS_BATCH_FIELD_TYPES)
+        if error is not None:
+            results.append({"error": error})
+            continue
+        results.append(label_news_text(
+            item["text_content"],
+            item.get("has_human_editor", False),
+            item.get("editor_name", ""),
+            item.get("language", "en")
+        ))
+    return results
+
+
+# 16-hex-char SHA-256 id of a media description. Always SHA-256, since the
+# media C2PA metadata declares that hash algorithm. Memoized because
+# descriptions are short and often repeat across batch generation.
+_short_hash = functools.lru_cache(maxsize=1024)(sha256_content_hash)
+
+
 @mcp.tool()
 def watermark_text(
     text_content: str,
     generator: str = "AI",
-    format_type: str = "plain"
+    format_type: str = "plain",
+    header_only: bool = False
 ) -> Dict[str, Any]:
     """
     Add metadata watermark to AI-generated text for EU AI Act Article 50(2) compliance.
@@ -330,6 +510,8 @@ def watermark_text(
         text_content: The AI-generated text to watermark
         generator: Name of the AI system that generated it (e.g., "GPT-4", "Claude", "Custom AI")
         format_type: Output format (plain, markdown, html). Default: "plain"
+        header_only: Return only the watermark_header to prepend to the text,
+            instead of a full watermarked_text copy (useful for large texts). Default: False
         
     Returns:
         Dictionary containing the watermarked text with embedded metadata
@@ -341,46 +523,50 @@ def watermark_text(
             format_type="markdown"
         )
     """
-    import hashlib
-    from datetime import datetime, timezone
     
     # Generate content hash for integrity verification
-    content_hash = hashlib.sha256(text_content.encode('utf-8')).hexdigest()[:16]
+    content_hash = text_content_hash(text_content)
     
     # Create timestamp
-    timestamp = datetime.now(timezone.utc).isoformat()
+    timestamp = utc_timestamp()
     
     # Create metadata
-    metadata = {
-        "ai_generated": True,
-        "generator": generator,
-        "timestamp": timestamp,
-        "content_hash": content_hash,
-        "compliance": "EU AI Act Article 50(2)",
-        "watermark_version": "1.0"
-    }
+    metadata = text_watermark_metadata(generator, timestamp, content_hash)
     
-    # Format the watermarked text based on format type
-    if format_type == "html":
-        watermarked_text = f'''<!-- AI-Generated Content Metadata
-{json.dumps(metadata, indent=2)}
--->
-{text_content}'''
-    elif format_type == "markdown":
-        watermarked_text = f'''<!-- AI Watermark: {json.dumps(metadata)} -->
-
-{text_content}'''
-    else:  # plain text
-        metadata_str = json.dumps(metadata, separators=(',', ':'))
-        watermarked_text = f"[AI-WATERMARK:{metadata_str}]\n\n{text_content}"
+    # Render the header for the requested format (unknown formats fall back
+    # to plain); only the generator needs JSON escaping, done with the same
+    # C string escaper json.dumps uses, minus the encoder dispatch
+    format_header = WATERMARK_HEADER_FORMATTERS.get(format_type, WATERMARK_HEADER_FORMATTERS["plain"])
+    header = format_header(encode_basestring_ascii(generator)[1:-1], timestamp, content_hash)
+    
+    original_length = len(text_content)
+    watermarked_length = len(header) + original_length
+    
+    # Large texts: hand back just the header so the text is not copied and
+    # sent back; the client prepends it to the text it already holds
+    if header_only:
+        return {
+            "article": "50(2)",
+            "obligation": "Content Watermarking (Text)",
+            "watermark_header": header,
+            "metadata": metadata,
+            "original_length": original_length,
+            "watermarked_length": watermarked_length,
+            "format": format_type,
+            "machine_readable": True,
+            "detectable": True,
+            "compliance_deadline": "2026-08-02",
+            "usage": "Prepend watermark_header to the original text. Metadata is machine-readable.",
+            "verification": f"Content hash: {content_hash}"
+        }
     
     return {
         "article": "50(2)",
         "obligation": "Content Watermarking (Text)",
-        "watermarked_text": watermarked_text,
+        "watermarked_text": header + text_content,
         "metadata": metadata,
-        "original_length": len(text_content),
-        "watermarked_length": len(watermarked_text),
+        "original_length": original_length,
+        "watermarked_length": watermarked_length,
         "format": format_type,
         "machine_readable": True,
         "detectable": True,
@@ -390,6 +576,113 @@ def watermark_text(
     }
 
 
+# Expected type of each watermark_texts item field
+_WATERMARK_BATCH_FIELD_TYPES = {
+    "text_content": str,
+    "generator": str,
+    "format_type": str,
+    "header_only": bool
+}
+
+
+@mcp.tool()
+def watermark_texts(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Watermark a batch of AI-generated texts in one call (EU AI Act Article 50(2)).
+    
+    Each item takes the same fields as watermark_text: text_content (required),
+    generator, format_type and header_only. Results are returned in order.
+    
+    Args:
+        items: List of texts to watermark
+        
+    Returns:
+        List of watermark_text results, one per item
+        
+    Example:
+        watermark_texts(items=[
+            {"text_content": "First AI text...", "generator": "GPT-4"},
+            {"text_content": "Second AI text...", "format_type": "markdown"}
+        ])
+    """
+    results = []
+    for item in items:
+        error = _batch_item_error(item, ("text_content",), _WATERMARK_BATCH_FIELD_TYPES)
+        if error is not None:
+            results.append({"error": error})
+            continue
+        results.append(watermark_text(
+            item["text_content"],
+            item.get("generator", "AI"),
+            item.get("format_type", "plain"),
+            item.get("header_only", False)
+        ))
+    return results
+
+
+# Fixed response fields of the deepfake label tools. Per-call values
+# (None here) are filled in by each tool; updating a copy keeps this key order.
+_DEEPFAKE_IMAGE_RESPONSE = MappingProxyType({
+    "article": "50(4)",
+    "obligation": "Deepfake Labeling (Image)",
+    "applies_to": "deployer",
+    "image_description": None,
+    "label_text": None,
+    "language": None,
+    "placement_options": IMAGE_PLACEMENT_OPTIONS,
+    "recommended_placement": "Top-left corner overlay with semi-transparent background",
+    "visibility_requirement": "Prominent and clearly distinguishable",
+    "label_persistence": "Must not be easily removable",
+    "is_artistic_work": None,
+    "is_satirical": None,
+    "exemption_applies": None,
+    "exemption_reason": None,
+    "compliance_deadline": "2026-08-02",
+    "implementation_notes": IMAGE_IMPLEMENTATION_NOTES,
+    "usage": "Add this label text to the image using one of the placement options"
+})
+
+_DEEPFAKE_VIDEO_RESPONSE = MappingProxyType({
+    "article": "50(4)",
+    "obligation": "Deepfake Labeling (Video)",
+    "applies_to": "deployer",
+    "video_description": None,
+    "label_text": None,
+    "language": None,
+    "placement_options": VIDEO_PLACEMENT_OPTIONS,
+    "recommended_placement": "Persistent semi-transparent overlay in top-left corner",
+    "visibility_requirement": "Clearly visible and distinguishable throughout playback",
+    "label_persistence": "Must persist in all playback formats and cannot be easily removed",
+    "timing_guidance": "If using title card, display for minimum 3 seconds at start",
+    "is_artistic_work": None,
+    "is_satirical": None,
+    "exemption_applies": None,
+    "exemption_reason": None,
+    "compliance_deadline": "2026-08-02",
+    "implementation_notes": VIDEO_IMPLEMENTATION_NOTES,
+    "usage": "Add this label to the video using one of the placement options"
+})
+
+_DEEPFAKE_AUDIO_RESPONSE = MappingProxyType({
+    "article": "50(4)",
+    "obligation": "Deepfake Labeling (Audio)",
+    "applies_to": "deployer",
+    "audio_description": None,
+    "written_label": None,
+    "spoken_label": None,
+    "language": None,
+    "disclosure_methods": AUDIO_DISCLOSURE_METHODS,
+    "recommended_method": "Spoken announcement at beginning + written metadata",
+    "spoken_disclosure_timing": "Beginning of audio (first 3 seconds)",
+    "is_artistic_work": None,
+    "exemption_applies": None,
+    "exemption_reason": None,
+    "compliance_deadline": "2026-08-02",
+    "implementation_notes": AUDIO_IMPLEMENTATION_NOTES,
+    "usage": "Add spoken disclosure at audio start and include written label in metadata/description"
+})
+
+
 @mcp.tool()
 def label_image_deepfake(
     image_description: str,
@@ -420,59 +713,34 @@ def label_image_deepfake(
             language="en"
         )
     """
-    labels_path = os.path.join(os.path.dirname(__file__), "resources", "deepfake_labels.json")
-    
-    with open(labels_path, 'r', encoding='utf-8') as f:
-        labels = json.load(f)
-    
-    # Get the appropriate label based on artistic status
-    try:
-        if is_artistic_work or is_satirical:
-            label_text = labels["image"][language]["artistic"]
-            exemption_applies = True
-            exemption_reason = "Artistic work or satire - modified disclosure"
-        else:
-            label_text = labels["image"][language]["standard"]
-            exemption_applies = False
-            exemption_reason = "Standard disclosure required"
-    except KeyError:
+    image_labels = _DEEPFAKE_LABELS["image"].get(language)
+    if image_labels is None:
         return {
             "error": f"Labels not found for language '{language}'",
-            "available_languages": list(labels.get("image", {}).keys())
+            "available_languages": _LABEL_LANGUAGES["image"]
         }
     
-    # Generate placement guidance
-    placement_options = [
-        "Top-left corner overlay",
-        "Bottom banner overlay",
-        "Visible watermark across image",
-        "Caption below image"
-    ]
-    
-    return {
-        "article": "50(4)",
-        "obligation": "Deepfake Labeling (Image)",
-        "applies_to": "deployer",
+    # Get the appropriate label based on artistic status
+    if is_artistic_work or is_satirical:
+        label_text = image_labels["artistic"]
+        exemption_applies = True
+        exemption_reason = "Artistic work or satire - modified disclosure"
+    else:
+        label_text = image_labels["standard"]
+        exemption_applies = False
+        exemption_reason = "Standard disclosure required"
+    
+    response = _DEEPFAKE_IMAGE_RESPONSE.copy()
+    response.update({
         "image_description": image_description,
         "label_text": label_text,
         "language": language,
-        "placement_options": placement_options,
-        "recommended_placement": "Top-left corner overlay with semi-transparent background",
-        "visibility_requirement": "Prominent and clearly distinguishable",
-        "label_persistence": "Must not be easily removable",
         "is_artistic_work": is_artistic_work,
         "is_satirical": is_satirical,
         "exemption_applies": exemption_applies,
-        "exemption_reason": exemption_reason,
-        "compliance_deadline": "2026-08-02",
-        "implementation_notes": [
-            "Label must be visible without zooming or special tools",
-            "Text size must be legible (minimum 12pt or 5% of image height)",
-            "Background contrast must ensure readability",
-            "Label should persist in downloaded/shared versions"
-        ],
-        "usage": "Add this label text to the image using one of the placement options"
-    }
+        "exemption_reason": exemption_reason
+    })
+    return response
 
 
 @mcp.tool()
@@ -505,61 +773,34 @@ def label_video_deepfake(
             language="en"
         )
     """
-    labels_path = os.path.join(os.path.dirname(__file__), "resources", "deepfake_labels.json")
-    
-    with open(labels_path, 'r', encoding='utf-8') as f:
-        labels = json.load(f)
-    
-    # Get the appropriate label based on artistic status
-    try:
-        if is_artistic_work or is_satirical:
-            label_text = labels["video"][language]["artistic"]
-            exemption_applies = True
-            exemption_reason = "Artistic work or satire - modified disclosure"
-        else:
-            label_text = labels["video"][language]["standard"]
-            exemption_applies = False
-            exemption_reason = "Standard disclosure required"
-    except KeyError:
+    video_labels = _DEEPFAKE_LABELS["video"].get(language)
+    if video_labels is None:
         return {
             "error": f"Labels not found for language '{language}'",
-            "available_languages": list(labels.get("video", {}).keys())
+            "available_languages": _LABEL_LANGUAGES["video"]
         }
     
-    # Generate placement guidance for video
-    placement_options = [
-        "Persistent overlay in corner throughout video",
-        "Opening title card (3-5 seconds)",
-        "Closing credit with disclosure",
-        "Intermittent overlay every 30 seconds"
-    ]
-    
-    return {
-        "article": "50(4)",
-        "obligation": "Deepfake Labeling (Video)",
-        "applies_to": "deployer",
+    # Get the appropriate label based on artistic status
+    if is_artistic_work or is_satirical:
+        label_text = video_labels["artistic"]
+        exemption_applies = True
+        exemption_reason = "Artistic work or satire - modified disclosure"
+    else:
+        label_text = video_labels["standard"]
+        exemption_applies = False
+        exemption_reason = "Standard disclosure required"
+    
+    response = _DEEPFAKE_VIDEO_RESPONSE.copy()
+    response.update({
         "video_description": video_description,
         "label_text": label_text,
         "language": language,
-        "placement_options": placement_options,
-        "recommended_placement": "Persistent semi-transparent overlay in top-left corner",
-        "visibility_requirement": "Clearly visible and distinguishable throughout playback",
-        "label_persistence": "Must persist in all playback formats and cannot be easily removed",
-        "timing_guidance": "If using title card, display for minimum 3 seconds at start",
         "is_artistic_work": is_artistic_work,
         "is_satirical": is_satirical,
         "exemption_applies": exemption_applies,
-        "exemption_reason": exemption_reason,
-        "compliance_deadline": "2026-08-02",
-        "implementation_notes": [
-            "Label must be visible at standard playback resolution",
-            "Text size must be legible (minimum 5% of frame height)",
-            "Use high contrast background for readability",
-            "Label must persist through video editing and re-encoding",
-            "Consider accessibility: include spoken disclosure for audio description"
-        ],
-        "usage": "Add this label to the video using one of the placement options"
-    }
+        "exemption_reason": exemption_reason
+    })
+    return response
 
 
 @mcp.tool()
@@ -590,56 +831,88 @@ def label_audio_deepfake(
             language="en"
         )
     """
-    labels_path = os.path.join(os.path.dirname(__file__), "resources", "deepfake_labels.json")
-    
-    with open(labels_path, 'r', encoding='utf-8') as f:
-        labels = json.load(f)
-    
-    # Get labels for audio
-    try:
-        written_label = labels["audio"][language]["standard"]
-        spoken_label = labels["audio"][language]["spoken"]
-        
-        exemption_applies = is_artistic_work
-        exemption_reason = "Artistic work - modified disclosure may apply" if is_artistic_work else "Standard disclosure required"
-    except KeyError:
+    audio_labels = _DEEPFAKE_LABELS["audio"].get(language)
+    if audio_labels is None:
         return {
             "error": f"Labels not found for language '{language}'",
-            "available_languages": list(labels.get("audio", {}).keys())
+            "available_languages": _LABEL_LANGUAGES["audio"]
         }
     
-    # Disclosure methods for audio
-    disclosure_methods = [
-        "Spoken announcement at beginning of audio",
-        "Written disclosure in audio player interface",
-        "Metadata embedded in audio file",
-        "Text description accompanying audio"
-    ]
+    # Get labels for audio
+    written_label = audio_labels["standard"]
+    spoken_label = audio_labels["spoken"]
     
-    return {
-        "article": "50(4)",
-        "obligation": "Deepfake Labeling (Audio)",
-        "applies_to": "deployer",
+    exemption_applies = is_artistic_work
+    exemption_reason = "Artistic work - modified disclosure may apply" if is_artistic_work else "Standard disclosure required"
+    
+    response = _DEEPFAKE_AUDIO_RESPONSE.copy()
+    response.update({
         "audio_description": audio_description,
         "written_label": written_label,
         "spoken_label": spoken_label,
         "language": language,
-        "disclosure_methods": disclosure_methods,
-        "recommended_method": "Spoken announcement at beginning + written metadata",
-        "spoken_disclosure_timing": "Beginning of audio (first 3 seconds)",
         "is_artistic_work": is_artistic_work,
         "exemption_applies": exemption_applies,
-        "exemption_reason": exemption_reason,
-        "compliance_deadline": "2026-08-02",
-        "implementation_notes": [
-            "Spoken disclosure should be clear and at normal speech volume",
-            "Written disclosure must accompany audio in player/platform",
-            "Embed disclosure in audio file metadata (ID3 tags, etc.)",
-            "Consider accessibility: provide written version for deaf users",
-            "Disclosure should be in same language as primary audio content"
-        ],
-        "usage": "Add spoken disclosure at audio start and include written label in metadata/description"
-    }
+        "exemption_reason": exemption_reason
+    })
+    return response
+
+
+# Fixed response fields of the media watermark tools, used like the
+# deepfake label responses above
+_WATERMARK_IMAGE_RESPONSE = MappingProxyType({
+    "article": "50(2)",
+    "obligation": "Content Watermarking (Image)",
+    "applies_to": "provider",
+    "image_description": None,
+    "generator": None,
+    "format": None,
+    "c2pa_metadata": None,
+    "iptc_metadata": None,
+    "watermark_standard": "C2PA 2.1",
+    "machine_readable": True,
+    "detectable": True,
+    "compliance_deadline": "2026-08-02",
+    "implementation_instructions": None,
+    "verification_url": "https://verify.contentauthenticity.org/",
+    "usage": "Use provided metadata to watermark the image file using C2PA-compliant tools"
+})
+
+_WATERMARK_VIDEO_RESPONSE = MappingProxyType({
+    "article": "50(2)",
+    "obligation": "Content Watermarking (Video)",
+    "applies_to": "provider",
+    "video_description": None,
+    "generator": None,
+    "format": None,
+    "c2pa_metadata": None,
+    "watermark_standard": "C2PA 2.1",
+    "watermark_method": "Frame-level embedding",
+    "machine_readable": True,
+    "detectable": True,
+    "compliance_deadline": "2026-08-02",
+    "implementation_instructions": None,
+    "verification_url": "https://verify.contentauthenticity.org/",
+    "usage": "Use provided metadata to watermark the video file using C2PA-compliant tools"
+})
+
+_WATERMARK_AUDIO_RESPONSE = MappingProxyType({
+    "article": "50(2)",
+    "obligation": "Content Watermarking (Audio)",
+    "applies_to": "provider",
+    "audio_description": None,
+    "generator": None,
+    "format": None,
+    "c2pa_metadata": None,
+    "audio_metadata": None,
+    "watermark_method": "Spectral embedding + ID3 tags",
+    "machine_readable": True,
+    "detectable": True,
+    "inaudible": True,
+    "compliance_deadline": "2026-08-02",
+    "implementation_instructions": None,
+    "usage": "Use provided metadata to watermark the audio file"
+})
 
 
 @mcp.tool()
@@ -669,11 +942,9 @@ def watermark_image(
             format_type="png"
         )
     """
-    from datetime import datetime, timezone
-    import hashlib
     
-    timestamp = datetime.now(timezone.utc).isoformat()
-    content_hash = hashlib.sha256(image_description.encode()).hexdigest()[:16]
+    timestamp = utc_timestamp()
+    content_hash = _short_hash(image_description)
     
     # C2PA metadata structure
     c2pa_metadata = {
@@ -702,29 +973,19 @@ def watermark_image(
         "Copyright Notice": "AI-generated content subject to EU AI Act Article 50(2)"
     }
     
-    return {
-        "article": "50(2)",
-        "obligation": "Content Watermarking (Image)",
-        "applies_to": "provider",
+    response = _WATERMARK_IMAGE_RESPONSE.copy()
+    response.update({
         "image_description": image_description,
         "generator": generator,
         "format": format_type,
         "c2pa_metadata": c2pa_metadata,
         "iptc_metadata": iptc_metadata,
-        "watermark_standard": "C2PA 2.1",
-        "machine_readable": True,
-        "detectable": True,
-        "compliance_deadline": "2026-08-02",
-        "implementation_instructions": [
+        "implementation_instructions": (
             f"1. Use C2PA library to embed metadata in {format_type} file",
-            "2. Add IPTC metadata as fallback",
-            "3. Ensure watermark survives compression and resizing",
-            "4. Verify watermark using C2PA verification tools",
-            "5. Store watermarked version separately from original"
-        ],
-        "verification_url": "https://verify.contentauthenticity.org/",
-        "usage": "Use provided metadata to watermark the image file using C2PA-compliant tools"
-    }
+            *IMAGE_INSTRUCTION_STEPS
+        )
+    })
+    return response
 
 
 @mcp.tool()
@@ -747,11 +1008,9 @@ def watermark_video(
     Returns:
         Dictionary with watermarking metadata, instructions, and compliance info
     """
-    from datetime import datetime, timezone
-    import hashlib
     
-    timestamp = datetime.now(timezone.utc).isoformat()
-    content_hash = hashlib.sha256(video_description.encode()).hexdigest()[:16]
+    timestamp = utc_timestamp()
+    content_hash = _short_hash(video_description)
     
     c2pa_metadata = {
         "claim_generator": "EU AI Act Compliance MCP Server",
@@ -770,29 +1029,18 @@ def watermark_video(
         "content_hash": content_hash
     }
     
-    return {
-        "article": "50(2)",
-        "obligation": "Content Watermarking (Video)",
-        "applies_to": "provider",
+    response = _WATERMARK_VIDEO_RESPONSE.copy()
+    response.update({
         "video_description": video_description,
         "generator": generator,
         "format": format_type,
         "c2pa_metadata": c2pa_metadata,
-        "watermark_standard": "C2PA 2.1",
-        "watermark_method": "Frame-level embedding",
-        "machine_readable": True,
-        "detectable": True,
-        "compliance_deadline": "2026-08-02",
-        "implementation_instructions": [
+        "implementation_instructions": (
             f"1. Use C2PA video library to embed metadata in {format_type} file",
-            "2. Apply watermark at frame level for persistence",
-            "3. Embed metadata in video container and frames",
-            "4. Ensure watermark survives re-encoding",
-            "5. Test with multiple video players"
-        ],
-        "verification_url": "https://verify.contentauthenticity.org/",
-        "usage": "Use provided metadata to watermark the video file using C2PA-compliant tools"
-    }
+            *VIDEO_INSTRUCTION_STEPS
+        )
+    })
+    return response
 
 
 @mcp.tool()
@@ -815,11 +1063,9 @@ def watermark_audio(
     Returns:
         Dictionary with watermarking metadata, instructions, and compliance info
     """
-    from datetime import datetime, timezone
-    import hashlib
     
-    timestamp = datetime.now(timezone.utc).isoformat()
-    content_hash = hashlib.sha256(audio_description.encode()).hexdigest()[:16]
+    timestamp = utc_timestamp()
+    content_hash = _short_hash(audio_description)
     
     c2pa_metadata = {
         "claim_generator": "EU AI Act Compliance MCP Server",
@@ -846,35 +1092,227 @@ def watermark_audio(
         }
     }
     
-    return {
-        "article": "50(2)",
-        "obligation": "Content Watermarking (Audio)",
-        "applies_to": "provider",
+    response = _WATERMARK_AUDIO_RESPONSE.copy()
+    response.update({
         "audio_description": audio_description,
         "generator": generator,
         "format": format_type,
         "c2pa_metadata": c2pa_metadata,
         "audio_metadata": audio_metadata,
-        "watermark_method": "Spectral embedding + ID3 tags",
-        "machine_readable": True,
-        "detectable": True,
-        "inaudible": True,
-        "compliance_deadline": "2026-08-02",
-        "implementation_instructions": [
+        "implementation_instructions": (
             f"1. Embed C2PA metadata in {format_type} file",
-            "2. Add ID3 tags for MP3 or equivalent for other formats",
-            "3. Apply inaudible spectral watermark (18-20kHz range)",
-            "4. Ensure watermark survives format conversion",
-            "5. Test detectability after compression"
-        ],
-        "usage": "Use provided metadata to watermark the audio file"
-    }
+            *AUDIO_INSTRUCTION_STEPS
+        )
+    })
+    return response
 
 
 # ============================================================================
 # RISK CLASSIFICATION TOOLS - Articles 5, 6, and Annex III
 # ============================================================================
 
+# use_case values (lowercased) classified as Annex III point 4(a) employment
+_EMPLOYMENT_USE_CASES = frozenset({"employment", "hiring", "hr", "recruitment"})
+
+# Fixed parts of the classify_ai_system_risk results, built once. Whole
+# responses leave system_description as None for the tool to fill in.
+_SOCIAL_SCORING_RISK_RESPONSE = MappingProxyType({
+    "risk_level": "PROHIBITED",
+    "article": "Article 5(1)(c)",
+    "reason": "Social scoring by public authorities or on their behalf",
+    "system_description": None,
+    "compliance_action": "MUST NOT deploy - System is prohibited",
+    "penalties": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
+    "deadline": "Immediate - Already in effect",
+    "recommendation": "Discontinue development or deployment immediately"
+})
+
+_EMOTION_DETECTION_RISK_RESPONSE = MappingProxyType({
+    "risk_level": "PROHIBITED",
+    "article": "Article 5(1)(f)",
+    "reason": "Emotion recognition in workplace or education (except medical/safety)",
+    "system_description": None,
+    "compliance_action": "MUST NOT deploy - System is prohibited",
+    "exception": "Allowed only for medical or safety reasons",
+    "penalties": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
+    "deadline": "Immediate - Already in effect",
+    "recommendation": "Remove emotion detection or limit to medical/safety contexts"
+})
+
+_CRIMINAL_PREDICTION_RISK_RESPONSE = MappingProxyType({
+    "risk_level": "PROHIBITED",
+    "article": "Article 5(1)(d)",
+    "reason": "Risk assessment predicting criminal offenses based on profiling",
+    "system_description": None,
+    "compliance_action": "MUST NOT deploy - System is prohibited",
+    "penalties": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
+    "deadline": "Immediate - Already in effect",
+    "recommendation": "Discontinue predictive profiling features"
+})
+
+_HIGH_RISK_OBLIGATIONS = (
+    "Risk management system (Article 9)",
+    "Data governance and management (Article 10)",
+    "Technical documentation (Article 11)",
+    "Record-keeping/logging (Article 12)",
+    "Transparency and information to users (Article 13)",
+    "Human oversight (Article 14)",
+    "Accuracy, robustness, cybersecurity (Article 15)",
+    "Quality management system (Article 17)",
+    "Conformity assessment (Article 43)",
+    "Registration in EU database (Article 49)",
+    "Post-market monitoring (Article 72)"
+)
+
+_HIGH_RISK_NEXT_STEPS = (
+    "Conduct conformity assessment",
+    "Implement risk management system",
+    "Create technical documentation",
+    "Establish human oversight mechanisms",
+    "Register in EU database before deployment"
+)
+
+_LIMITED_RISK_NEXT_STEPS = (
+    "Implement transparency disclosures (Article 50)",
+    "Add watermarks if generating content (Article 50(2))",
+    "Ensure users know they're interacting with AI (Article 50(1))"
+)
+
+_MINIMAL_RISK_RESPONSE = MappingProxyType({
+    "risk_level": "MINIMAL-RISK",
+    "article": "No specific article applies",
+    "reason": "System does not fall under prohibited, high-risk, or limited-risk categories",
+    "system_description": None,
+    "applicable_obligations": (
+        "Voluntary codes of conduct (Article 95)",
+        "General transparency best practices"
+    ),
+    "compliance_deadline": "No mandatory deadline",
+    "penalties_if_non_compliant": "None (voluntary compliance)",
+    "next_steps": (
+        "Consider voluntary transparency measures",
+        "Follow industry best practices",
+        "Monitor for regulatory updates"
+    )
+})
+
+
+# Checks in the order _classify_risk applies them; each table lines up with
+# the tuple of flags it is zipped against there
+_PROHIBITED_RISK_RESPONSES = (
+    _SOCIAL_SCORING_RISK_RESPONSE,
+    _EMOTION_DETECTION_RISK_RESPONSE,
+    _CRIMINAL_PREDICTION_RISK_RESPONSE
+)
+
+_HIGH_RISK_CHECKS = (
+    MappingProxyType({
+        "reason": "Biometric identification or categorization",
+        "annex_point": "Annex III point 1",
+        "article_ref": "Article 6(2)"
+    }),
+    MappingProxyType({
+        "reason": "AI system for employment, recruitment, or HR decisions",
+        "annex_point": "Annex III point 4(a)",
+        "article_ref": "Article 6(2)"
+    }),
+    MappingProxyType({
+        "reason": "AI system for education or vocational training",
+        "annex_point": "Annex III point 3",
+        "article_ref": "Article 6(2)"
+    }),
+    MappingProxyType({
+        "reason": "AI system for law enforcement",
+        "annex_point": "Annex III point 6",
+        "article_ref": "Article 6(2)"
+    }),
+    MappingProxyType({
+        "reason": "AI system for critical infrastructure",
+        "annex_point": "Annex III point 2",
+        "article_ref": "Article 6(2)"
+    })
+)
+
+_HIGH_RISK_REASONS = tuple(check["reason"] for check in _HIGH_RISK_CHECKS)
+
+_LIMITED_RISK_CHECKS = (
+    MappingProxyType({
+        "reason": "AI system interacts with natural persons",
+        "article": "Article 50(1)",
+        "obligation": "Must disclose AI interaction to users"
+    }),
+    MappingProxyType({
+        "reason": "Generates synthetic audio, image, video, or text content",
+        "article": "Article 50(2)",
+        "obligation": "Must watermark AI-generated content"
+    })
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify_risk(
+    employment_use_case: bool,
+    biometric_data: bool,
+    critical_infrastructure: bool,
+    education: bool,
+    law_enforcement: bool,
+    predicts_criminal_behavior: bool,
+    social_scoring: bool,
+    emotion_detection_workplace: bool,
+    generates_content: bool,
+    interacts_with_users: bool
+) -> MappingProxyType:
+    """
+    Risk classification for one combination of flags, with system_description
+    left as None for the tool to fill in. The outcome depends only on these
+    ten booleans, so the cache holds every possible result; results are
+    read-only and use tuples so cached values cannot be altered.
+    """
+    # Step 1: Check Article 5 - PROHIBITED practices
+    prohibited_flags = (social_scoring, emotion_detection_workplace, predicts_criminal_behavior)
+    for flagged, response in zip(prohibited_flags, _PROHIBITED_RISK_RESPONSES):
+        if flagged:
+            return response
+    
+    # Step 2: Check Article 6 + Annex III - HIGH-RISK systems
+    high_risk_flags = (biometric_data, employment_use_case, education, law_enforcement, critical_infrastructure)
+    high_risk_factors = tuple(compress(_HIGH_RISK_REASONS, high_risk_flags))
+    
+    if high_risk_factors:
+        first_check = next(compress(_HIGH_RISK_CHECKS, high_risk_flags))
+        return MappingProxyType({
+            "risk_level": "HIGH-RISK",
+            "article": first_check["article_ref"],
+            "annex_reference": first_check["annex_point"],
+            "reason": first_check["reason"],
+            "system_description": None,
+            "all_high_risk_factors": high_risk_factors,
+            "applicable_obligations": _HIGH_RISK_OBLIGATIONS,
+            "compliance_deadline": "2027-08-02",
+            "penalties_if_non_compliant": "Up to €15 million or 3% of global annual turnover",
+            "next_steps": _HIGH_RISK_NEXT_STEPS
+        })
+    
+    # Step 3: Check Article 50 - LIMITED-RISK systems
+    limited_risk_flags = (interacts_with_users, generates_content)
+    limited_risk_checks = [check for flagged, check in zip(limited_risk_flags, _LIMITED_RISK_CHECKS) if flagged]
+    
+    if limited_risk_checks:
+        return MappingProxyType({
+            "risk_level": "LIMITED-RISK",
+            "article": "Article 50",
+            "reason": "; ".join([check["reason"] for check in limited_risk_checks]),
+            "system_description": None,
+            "applicable_obligations": tuple(check["obligation"] for check in limited_risk_checks),
+            "compliance_deadline": "2026-08-02",
+            "penalties_if_non_compliant": "Up to €15 million or 3% of global annual turnover",
+            "next_steps": _LIMITED_RISK_NEXT_STEPS
+        })
+    
+    # Step 4: Default - MINIMAL-RISK
+    return _MINIMAL_RISK_RESPONSE
+
+
 @mcp.tool()
 def classify_ai_system_risk(
     system_description: str,
@@ -911,166 +1349,162 @@ def classify_ai_system_risk(
     Returns:
         Risk classification with applicable obligations and deadlines
     """
+    response = _classify_risk(
+        use_case.lower() in _EMPLOYMENT_USE_CASES,
+        biometric_data,
+        critical_infrastructure,
+        education,
+        law_enforcement,
+        predicts_criminal_behavior,
+        social_scoring,
+        emotion_detection_workplace,
+        generates_content,
+        interacts_with_users
+    ).copy()
+    response["system_description"] = system_description
+    return response
+
+
+# Expected type of each classify_ai_system_risks item field
+_RISK_BATCH_FIELD_TYPES = {
+    "system_description": str,
+    "use_case": str,
+    "biometric_data": bool,
+    "critical_infrastructure": bool,
+    "education": bool,
+    "law_enforcement": bool,
+    "predicts_criminal_behavior": bool,
+    "social_scoring": bool,
+    "emotion_detection_workplace": bool,
+    "generates_content": bool,
+    "interacts_with_users": bool
+}
+
+
+@mcp.tool()
+def classify_ai_system_risks(systems: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Classify a batch of AI systems in one call (EU AI Act Articles 5, 6, 50).
     
-    # Step 1: Check Article 5 - PROHIBITED practices
-    if social_scoring:
-        return {
-            "risk_level": "PROHIBITED",
-            "article": "Article 5(1)(c)",
-            "reason": "Social scoring by public authorities or on their behalf",
-            "system_description": system_description,
-            "compliance_action": "MUST NOT deploy - System is prohibited",
-            "penalties": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
-            "deadline": "Immediate - Already in effect",
-            "recommendation": "Discontinue development or deployment immediately"
-        }
-    
-    if emotion_detection_workplace:
-        return {
-            "risk_level": "PROHIBITED",
-            "article": "Article 5(1)(f)",
-            "reason": "Emotion recognition in workplace or education (except medical/safety)",
-            "system_description": system_description,
-            "compliance_action": "MUST NOT deploy - System is prohibited",
-            "exception": "Allowed only for medical or safety reasons",
-            "penalties": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
-            "deadline": "Immediate - Already in effect",
-            "recommendation": "Remove emotion detection or limit to medical/safety contexts"
-        }
-    
-    if predicts_criminal_behavior:
-        return {
-            "risk_level": "PROHIBITED",
-            "article": "Article 5(1)(d)",
-            "reason": "Risk assessment predicting criminal offenses based on profiling",
-            "system_description": system_description,
-            "compliance_action": "MUST NOT deploy - System is prohibited",
-            "penalties": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
-            "deadline": "Immediate - Already in effect",
-            "recommendation": "Discontinue predictive profiling features"
-        }
-    
-    # Step 2: Check Article 6 + Annex III - HIGH-RISK systems
-    high_risk_checks = []
-    
-    if biometric_data:
-        high_risk_checks.append({
-            "reason": "Biometric identification or categorization",
-            "annex_point": "Annex III point 1",
-            "article_ref": "Article 6(2)"
-        })
-    
-    if use_case.lower() in ["employment", "hiring", "hr", "recruitment"]:
-        high_risk_checks.append({
-            "reason": "AI system for employment, recruitment, or HR decisions",
-            "annex_point": "Annex III point 4(a)",
-            "article_ref": "Article 6(2)"
-        })
-    
-    if education:
-        high_risk_checks.append({
-            "reason": "AI system for education or vocational training",
-            "annex_point": "Annex III point 3",
-            "article_ref": "Article 6(2)"
-        })
-    
-    if law_enforcement:
-        high_risk_checks.append({
-            "reason": "AI system for law enforcement",
-            "annex_point": "Annex III point 6",
-            "article_ref": "Article 6(2)"
-        })
-    
-    if critical_infrastructure:
-        high_risk_checks.append({
-            "reason": "AI system for critical infrastructure",
-            "annex_point": "Annex III point 2",
-            "article_ref": "Article 6(2)"
-        })
-    
-    if high_risk_checks:
-        return {
-            "risk_level": "HIGH-RISK",
-            "article": high_risk_checks[0]["article_ref"],
-            "annex_reference": high_risk_checks[0]["annex_point"],
-            "reason": high_risk_checks[0]["reason"],
-            "system_description": system_description,
-            "all_high_risk_factors": [check["reason"] for check in high_risk_checks],
-            "applicable_obligations": [
-                "Risk management system (Article 9)",
-                "Data governance and management (Article 10)",
-                "Technical documentation (Article 11)",
-                "Record-keeping/logging (Article 12)",
-                "Transparency and information to users (Article 13)",
-                "Human oversight (Article 14)",
-                "Accuracy, robustness, cybersecurity (Article 15)",
-                "Quality management system (Article 17)",
-                "Conformity assessment (Article 43)",
-                "Registration in EU database (Article 49)",
-                "Post-market monitoring (Article 72)"
-            ],
-            "compliance_deadline": "2027-08-02",
-            "penalties_if_non_compliant": "Up to €15 million or 3% of global annual turnover",
-            "next_steps": [
-                "Conduct conformity assessment",
-                "Implement risk management system",
-                "Create technical documentation",
-                "Establish human oversight mechanisms",
-                "Register in EU database before deployment"
-            ]
-        }
-    
-    # Step 3: Check Article 50 - LIMITED-RISK systems
-    limited_risk_checks = []
-    
-    if interacts_with_users:
-        limited_risk_checks.append({
-            "reason": "AI system interacts with natural persons",
-            "article": "Article 50(1)",
-            "obligation": "Must disclose AI interaction to users"
-        })
-    
-    if generates_content:
-        limited_risk_checks.append({
-            "reason": "Generates synthetic audio, image, video, or text content",
-            "article": "Article 50(2)",
-            "obligation": "Must watermark AI-generated content"
-        })
-    
-    if limited_risk_checks:
-        return {
-            "risk_level": "LIMITED-RISK",
-            "article": "Article 50",
-            "reason": "; ".join([check["reason"] for check in limited_risk_checks]),
-            "system_description": system_description,
-            "applicable_obligations": [check["obligation"] for check in limited_risk_checks],
-            "compliance_deadline": "2026-08-02",
-            "penalties_if_non_compliant": "Up to €15 million or 3% of global annual turnover",
-            "next_steps": [
-                "Implement transparency disclosures (Article 50)",
-                "Add watermarks if generating content (Article 50(2))",
-                "Ensure users know they're interacting with AI (Article 50(1))"
-            ]
-        }
+    Each system takes the same fields as classify_ai_system_risk:
+    system_description and use_case (required) plus the optional boolean risk
+    flags, which default to False. Results are returned in order.
     
-    # Step 4: Default - MINIMAL-RISK
-    return {
-        "risk_level": "MINIMAL-RISK",
-        "article": "No specific article applies",
-        "reason": "System does not fall under prohibited, high-risk, or limited-risk categories",
-        "system_description": system_description,
-        "applicable_obligations": [
-            "Voluntary codes of conduct (Article 95)",
-            "General transparency best practices"
-        ],
-        "compliance_deadline": "No mandatory deadline",
-        "penalties_if_non_compliant": "None (voluntary compliance)",
-        "next_steps": [
-            "Consider voluntary transparency measures",
-            "Follow industry best practices",
-            "Monitor for regulatory updates"
-        ]
-    }
+    Args:
+        systems: List of AI systems to classify
+        
+    Returns:
+        List of classify_ai_system_risk results, one per system
+        
+    Example:
+        classify_ai_system_risks(systems=[
+            {"system_description": "Resume screening tool", "use_case": "hiring"},
+            {"system_description": "Customer support chatbot", "use_case": "chatbot", "interacts_with_users": True}
+        ])
+    """
+    results = []
+    for system in systems:
+        error = _batch_item_error(system, ("system_description", "use_case"), _RISK_BATCH_FIELD_TYPES)
+        if error is not None:
+            results.append({"error": error})
+            continue
+        results.append(classify_ai_system_risk(
+            system["system_description"],
+            system["use_case"],
+            system.get("biometric_data", False),
+            system.get("critical_infrastructure", False),
+            system.get("education", False),
+            system.get("law_enforcement", False),
+            system.get("predicts_criminal_behavior", False),
+            system.get("social_scoring", False),
+            system.get("emotion_detection_workplace", False),
+            system.get("generates_content", False),
+            system.get("interacts_with_users", False)
+        ))
+    return results
+
+
+# Article 5 violation reported for each check_prohibited_practices flag,
+# and the fixed parts of its results, built once
+_ARTICLE5_VIOLATIONS = MappingProxyType({
+    "uses_subliminal_techniques": MappingProxyType({
+        "article": "Article 5(1)(a)",
+        "violation": "Subliminal techniques to manipulate behavior",
+        "description": "AI systems that deploy subliminal techniques beyond a person's consciousness to materially distort behavior",
+        "penalty": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
+        "exception": "None"
+    }),
+    "exploits_vulnerabilities": MappingProxyType({
+        "article": "Article 5(1)(b)",
+        "violation": "Exploitation of vulnerabilities",
+        "description": "AI systems that exploit vulnerabilities of specific groups (age, disability, social/economic situation)",
+        "penalty": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
+        "exception": "None"
+    }),
+    "social_scoring": MappingProxyType({
+        "article": "Article 5(1)(c)",
+        "violation": "Social scoring",
+        "description": "AI systems for social scoring by public authorities or on their behalf",
+        "penalty": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
+        "exception": "None"
+    }),
+    "predicts_crime_from_profiling": MappingProxyType({
+        "article": "Article 5(1)(d)",
+        "violation": "Predictive policing based on profiling",
+        "description": "AI systems that make risk assessments of natural persons to predict criminal offenses based solely on profiling",
+        "penalty": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
+        "exception": "None"
+    }),
+    "scrapes_facial_images": MappingProxyType({
+        "article": "Article 5(1)(e)",
+        "violation": "Untargeted scraping of facial images",
+        "description": "Creating or expanding facial recognition databases through untargeted scraping from internet or CCTV",
+        "penalty": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
+        "exception": "None"
+    }),
+    "detects_emotions_in_workplace": MappingProxyType({
+        "article": "Article 5(1)(f)",
+        "violation": "Emotion recognition in workplace or education",
+        "description": "AI systems that infer emotions in workplace or educational institutions",
+        "penalty": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
+        "exception": "Medical or safety reasons only"
+    }),
+    "biometric_categorization_sensitive_attributes": MappingProxyType({
+        "article": "Article 5(1)(g)",
+        "violation": "Biometric categorization of sensitive attributes",
+        "description": "Biometric categorization systems that infer race, political opinions, trade union membership, religious/philosophical beliefs, sex life, or sexual orientation",
+        "penalty": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
+        "exception": "Limited exceptions for law enforcement with safeguards"
+    }),
+    "real_time_biometric_identification_public": MappingProxyType({
+        "article": "Article 5(1)(h)",
+        "violation": "Real-time remote biometric identification in public",
+        "description": "Real-time remote biometric identification systems in publicly accessible spaces for law enforcement",
+        "penalty": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
+        "exception": "Very limited exceptions for serious crimes with judicial authorization"
+    })
+})
+
+_PROHIBITED_REQUIRED_ACTIONS = (
+    "Cease development and deployment immediately",
+    "Notify relevant supervisory authorities",
+    "Assess alternatives that comply with EU AI Act",
+    "Consult legal counsel for remediation strategy"
+)
+
+_NO_PROHIBITED_PRACTICES_RESPONSE = MappingProxyType({
+    "is_prohibited": False,
+    "severity": "None",
+    "violations": (),
+    "violation_count": 0,
+    "recommendation": "No prohibited practices detected",
+    "compliance_status": "COMPLIANT with Article 5 prohibitions",
+    "next_steps": (
+        "Continue to check high-risk and limited-risk classifications",
+        "Monitor for regulatory updates",
+        "Maintain compliance documentation"
+    )
+})
 
 
 @mcp.tool()
@@ -1103,158 +1537,208 @@ def check_prohibited_practices(
         Violations found with penalties and recommendations
     """
     
+    # Most systems set no flag; settle that with one short-circuit test
+    if not (
+        uses_subliminal_techniques
+        or exploits_vulnerabilities
+        or social_scoring
+        or predicts_crime_from_profiling
+        or scrapes_facial_images
+        or detects_emotions_in_workplace
+        or biometric_categorization_sensitive_attributes
+        or real_time_biometric_identification_public
+    ):
+        return _NO_PROHIBITED_PRACTICES_RESPONSE.copy()
+    
     violations = []
     
     if uses_subliminal_techniques:
-        violations.append({
-            "article": "Article 5(1)(a)",
-            "violation": "Subliminal techniques to manipulate behavior",
-            "description": "AI systems that deploy subliminal techniques beyond a person's consciousness to materially distort behavior",
-            "penalty": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
-            "exception": "None"
-        })
+        violations.append(_ARTICLE5_VIOLATIONS["uses_subliminal_techniques"].copy())
     
     if exploits_vulnerabilities:
-        violations.append({
-            "article": "Article 5(1)(b)",
-            "violation": "Exploitation of vulnerabilities",
-            "description": "AI systems that exploit vulnerabilities of specific groups (age, disability, social/economic situation)",
-            "penalty": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
-            "exception": "None"
-        })
+        violations.append(_ARTICLE5_VIOLATIONS["exploits_vulnerabilities"].copy())
     
     if social_scoring:
-        violations.append({
-            "article": "Article 5(1)(c)",
-            "violation": "Social scoring",
-            "description": "AI systems for social scoring by public authorities or on their behalf",
-            "penalty": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
-            "exception": "None"
-        })
+        violations.append(_ARTICLE5_VIOLATIONS["social_scoring"].copy())
     
     if predicts_crime_from_profiling:
-        violations.append({
-            "article": "Article 5(1)(d)",
-            "violation": "Predictive policing based on profiling",
-            "description": "AI systems that make risk assessments of natural persons to predict criminal offenses based solely on profiling",
-            "penalty": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
-            "exception": "None"
-        })
+        violations.append(_ARTICLE5_VIOLATIONS["predicts_crime_from_profiling"].copy())
     
     if scrapes_facial_images:
-        violations.append({
-            "article": "Article 5(1)(e)",
-            "violation": "Untargeted scraping of facial images",
-            "description": "Creating or expanding facial recognition databases through untargeted scraping from internet or CCTV",
-            "penalty": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
-            "exception": "None"
-        })
+        violations.append(_ARTICLE5_VIOLATIONS["scrapes_facial_images"].copy())
     
     if detects_emotions_in_workplace:
-        violations.append({
-            "article": "Article 5(1)(f)",
-            "violation": "Emotion recognition in workplace or education",
-            "description": "AI systems that infer emotions in workplace or educational institutions",
-            "penalty": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
-            "exception": "Medical or safety reasons only"
-        })
+        violations.append(_ARTICLE5_VIOLATIONS["detects_emotions_in_workplace"].copy())
     
     if biometric_categorization_sensitive_attributes:
-        violations.append({
-            "article": "Article 5(1)(g)",
-            "violation": "Biometric categorization of sensitive attributes",
-            "description": "Biometric categorization systems that infer race, political opinions, trade union membership, religious/philosophical beliefs, sex life, or sexual orientation",
-            "penalty": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
-            "exception": "Limited exceptions for law enforcement with safeguards"
-        })
+        violations.append(_ARTICLE5_VIOLATIONS["biometric_categorization_sensitive_attributes"].copy())
     
     if real_time_biometric_identification_public:
-        violations.append({
-            "article": "Article 5(1)(h)",
-            "violation": "Real-time remote biometric identification in public",
-            "description": "Real-time remote biometric identification systems in publicly accessible spaces for law enforcement",
-            "penalty": "Up to €35 million or 7% of global annual turnover (whichever is higher)",
-            "exception": "Very limited exceptions for serious crimes with judicial authorization"
-        })
-    
-    if violations:
-        return {
-            "is_prohibited": True,
-            "severity": "CRITICAL - Highest penalty tier",
-            "violations": violations,
-            "violation_count": len(violations),
-            "total_penalty_exposure": "Up to €35 million or 7% of global annual turnover PER violation",
-            "recommendation": "STOP IMMEDIATELY - These AI practices are PROHIBITED under EU AI Act",
-            "required_actions": [
-                "Cease development and deployment immediately",
-                "Notify relevant supervisory authorities",
-                "Assess alternatives that comply with EU AI Act",
-                "Consult legal counsel for remediation strategy"
-            ],
-            "compliance_status": "NON-COMPLIANT - Critical violation"
-        }
+        violations.append(_ARTICLE5_VIOLATIONS["real_time_biometric_identification_public"].copy())
     
     return {
-        "is_prohibited": False,
-        "severity": "None",
-        "violations": [],
-        "violation_count": 0,
-        "recommendation": "No prohibited practices detected",
-        "compliance_status": "COMPLIANT with Article 5 prohibitions",
-        "next_steps": [
-            "Continue to check high-risk and limited-risk classifications",
-            "Monitor for regulatory updates",
-            "Maintain compliance documentation"
-        ]
+        "is_prohibited": True,
+        "severity": "CRITICAL - Highest penalty tier",
+        "violations": violations,
+        "violation_count": len(violations),
+        "total_penalty_exposure": "Up to €35 million or 7% of global annual turnover PER violation",
+        "recommendation": "STOP IMMEDIATELY - These AI practices are PROHIBITED under EU AI Act",
+        "required_actions": _PROHIBITED_REQUIRED_ACTIONS,
+        "compliance_status": "NON-COMPLIANT - Critical violation"
     }
 
 
-@mcp.tool()
-def determine_eu_ai_act_role(
-    company_description: str,
-    company_location: str,
-    develops_ai_system: bool = False,
-    uses_ai_system: bool = False,
-    sells_ai_system: bool = False,
-    imports_to_eu: bool = False,
-    distributes_in_eu: bool = False,
-    integrates_ai_into_product: bool = False,
-    represents_non_eu_provider: bool = False,
-    under_own_name_or_trademark: bool = False,
-    substantial_modification: bool = False,
-    change_intended_purpose: bool = False
-) -> Dict[str, Any]:
+# Locations treated as EU-based: exact names, and member states matched
+# anywhere in the lowercased location with one compiled alternation
+_EU_LOCATIONS = frozenset({"eu", "european union"})
+_EU_COUNTRY_RE = re.compile("germany|france|spain|italy|netherlands|belgium|austria|ireland|portugal|greece")
+
+
+# Role details reported by determine_eu_ai_act_role, built once. Reasons
+# that depend on the company are None here and filled in per call.
+_PROVIDER_ROLE = MappingProxyType({
+    "article": "Article 3(3)",
+    "definition": "Develops the AI system or has it developed, and places it on the market or puts it into service under own name or trademark",
+    "applies_to_you": True,
+    "reason": None,
+    "key_obligations": (
+        "Establish risk management system (Article 9)",
+        "Data governance and quality (Article 10)",
+        "Technical documentation (Article 11)",
+        "Automatic logging (Article 12)",
+        "Design for human oversight (Article 14)",
+        "Accuracy and robustness (Article 15)",
+        "Cybersecurity measures (Article 15)",
+        "Quality management system (Article 17)",
+        "Conformity assessment (Article 43)",
+        "CE marking (Article 48)",
+        "EU database registration (Article 49)"
+    ),
+    "deadline": "2027-08-02 (for high-risk systems)",
+    "penalties": "Up to €15M or 3% of global turnover for non-compliance"
+})
+
+_DEPLOYER_ROLE = MappingProxyType({
+    "article": "Article 3(4)",
+    "definition": "Uses an AI system under their authority, except for personal non-professional activity",
+    "applies_to_you": True,
+    "reason": "You use AI systems in your operations",
+    "key_obligations": (
+        "Use AI according to instructions (Article 26(1))",
+        "Ensure human oversight (Article 26(2))",
+        "Monitor AI system operation (Article 26(3))",
+        "Report serious incidents (Article 26(4))",
+        "Keep logs generated by AI system (Article 26(5))",
+        "Conduct fundamental rights impact assessment (Article 27)",
+        "Inform workers about AI monitoring systems (Article 26(7))",
+        "Ensure input data quality (Article 26(6))"
+    ),
+    "deadline": "2027-08-02 (for high-risk systems)",
+    "penalties": "Up to €15M or 3% of global turnover for non-compliance"
+})
+
+_IMPORTER_ROLE = MappingProxyType({
+    "article": "Article 3(5)",
+    "definition": "Places on the market an AI system that bears the name or trademark of a person established outside the EU",
+    "applies_to_you": True,
+    "reason": None,
+    "key_obligations": (
+        "Verify provider's conformity assessment (Article 23(1))",
+        "Verify CE marking and documentation (Article 23(2))",
+        "Ensure registration in EU database (Article 23(3))",
+        "Keep copy of technical documentation (Article 23(4))",
+        "Provide authorities with documentation (Article 23(5))",
+        "Ensure storage/transport doesn't affect compliance (Article 23(6))",
+        "Appoint authorized representative in EU (Article 22)"
+    ),
+    "deadline": "2027-08-02",
+    "penalties": "Up to €15M or 3% of global turnover for non-compliance"
+})
+
+_DISTRIBUTOR_ROLE = MappingProxyType({
+    "article": "Article 3(6)",
+    "definition": "Makes an AI system available on the market without being the provider or importer",
+    "applies_to_you": True,
+    "reason": "You distribute AI systems in the EU market",
+    "key_obligations": (
+        "Verify CE marking present (Article 24(1))",
+        "Verify required documentation provided (Article 24(2))",
+        "Verify provider/importer obligations met (Article 24(3))",
+        "Inform provider/importer of non-compliance (Article 24(4))",
+        "Cooperate with authorities (Article 24(5))"
+    ),
+    "deadline": "2027-08-02",
+    "penalties": "Up to €15M or 3% of global turnover for non-compliance"
+})
+
+_AUTHORIZED_REPRESENTATIVE_ROLE = MappingProxyType({
+    "article": "Article 3(7)",
+    "definition": "Natural or legal person located in the EU who has received a written mandate from a provider outside the EU",
+    "applies_to_you": True,
+    "reason": None,
+    "key_obligations": (
+        "Perform tasks specified in mandate (Article 22(1))",
+        "Provide copy of technical documentation to authorities (Article 22(2))",
+        "Cooperate with authorities (Article 22(3))",
+        "Terminate mandate if provider non-compliant (Article 22(4))"
+    ),
+    "deadline": "2027-08-02",
+    "penalties": "Provider's penalties may apply"
+})
+
+_PRODUCT_MANUFACTURER_ROLE = MappingProxyType({
+    "article": "Article 3(8) + Article 25",
+    "definition": "Manufactures a product and integrates an AI system into it, where the AI is a safety component or the product itself",
+    "applies_to_you": True,
+    "reason": "You integrate AI systems into physical products under your name/trademark",
+    "key_obligations": (
+        "Assume provider obligations for AI component (Article 25(1))",
+        "Ensure AI system complies with requirements (Article 25(2))",
+        "Affix own name/trademark to product (Article 25(3))",
+        "Follow relevant product safety legislation",
+        "Conduct conformity assessment for AI component"
+    ),
+    "deadline": "2027-08-02",
+    "penalties": "Provider penalties apply (up to €15M or 3% of turnover)"
+})
+
+_NO_DIRECT_ROLE_RESPONSE = MappingProxyType({
+    "primary_role": "NO DIRECT ROLE",
+    "additional_roles": (),
+    "role_details": MappingProxyType({}),
+    "company_description": None,
+    "company_location": None,
+    "assessment": "Based on provided information, you may not have direct EU AI Act obligations",
+    "recommendation": "If you interact with AI systems in any way, review the questions again. You may be a deployer if you use AI systems.",
+    "next_steps": (
+        "Verify you are not using AI systems in your operations",
+        "If you are using AI, you are likely a DEPLOYER",
+        "Monitor for regulatory changes that may affect your activities"
+    )
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _determine_roles(
+    is_in_eu: bool,
+    develops_ai_system: bool,
+    uses_ai_system: bool,
+    sells_ai_system: bool,
+    imports_to_eu: bool,
+    distributes_in_eu: bool,
+    integrates_ai_into_product: bool,
+    represents_non_eu_provider: bool,
+    under_own_name_or_trademark: bool,
+    substantial_modification: bool,
+    change_intended_purpose: bool
+) -> MappingProxyType:
     """
-    Determine which EU AI Act role(s) apply to your organization.
-    
-    Different roles have different obligations under the EU AI Act.
-    Understanding your role is CRITICAL to knowing which requirements apply.
-    
-    Args:
-        company_description: Brief description of your company/organization
-        company_location: Country/region where company is based
-        develops_ai_system: You develop AI systems or commission their development
-        uses_ai_system: You use AI systems in your operations
-        sells_ai_system: You sell or offer AI systems
-        imports_to_eu: You bring AI systems from outside EU into EU market
-        distributes_in_eu: You distribute/resell AI systems in EU
-        integrates_ai_into_product: You integrate AI into physical products
-        represents_non_eu_provider: You represent a non-EU AI provider in the EU
-        under_own_name_or_trademark: AI system bears your name/trademark
-        substantial_modification: You substantially modify existing AI systems
-        change_intended_purpose: You change the intended purpose of AI systems
-        
-    Returns:
-        Role determination with definitions and applicable obligations
+    Role determination for one combination of flags, with the company fields
+    and the location-based reasons left as None for the tool to fill in.
+    Cached and read-only like _classify_risk.
     """
-    
     roles_identified = []
     role_details = {}
-    is_in_eu = company_location.lower() in ["eu", "european union"] or any(
-        country in company_location.lower() 
-        for country in ["germany", "france", "spain", "italy", "netherlands", 
-                       "belgium", "austria", "ireland", "portugal", "greece"]
-    )
     
     # Step 1: Check if PROVIDER
     is_provider = (
@@ -1276,51 +1760,14 @@ def determine_eu_ai_act_role(
             reason_parts.append("changes intended purpose of AI systems")
         
         roles_identified.append("PROVIDER")
-        role_details["provider"] = {
-            "article": "Article 3(3)",
-            "definition": "Develops the AI system or has it developed, and places it on the market or puts it into service under own name or trademark",
-            "applies_to_you": True,
-            "reason": f"You {' and '.join(reason_parts)}",
-            "key_obligations": [
-                "Establish risk management system (Article 9)",
-                "Data governance and quality (Article 10)",
-                "Technical documentation (Article 11)",
-                "Automatic logging (Article 12)",
-                "Design for human oversight (Article 14)",
-                "Accuracy and robustness (Article 15)",
-                "Cybersecurity measures (Article 15)",
-                "Quality management system (Article 17)",
-                "Conformity assessment (Article 43)",
-                "CE marking (Article 48)",
-                "EU database registration (Article 49)"
-            ],
-            "deadline": "2027-08-02 (for high-risk systems)",
-            "penalties": "Up to €15M or 3% of global turnover for non-compliance"
-        }
+        role_details["provider"] = MappingProxyType({**_PROVIDER_ROLE, "reason": f"You {' and '.join(reason_parts)}"})
     
     # Step 2: Check if DEPLOYER
     is_deployer = uses_ai_system
     
     if is_deployer:
         roles_identified.append("DEPLOYER")
-        role_details["deployer"] = {
-            "article": "Article 3(4)",
-            "definition": "Uses an AI system under their authority, except for personal non-professional activity",
-            "applies_to_you": True,
-            "reason": "You use AI systems in your operations",
-            "key_obligations": [
-                "Use AI according to instructions (Article 26(1))",
-                "Ensure human oversight (Article 26(2))",
-                "Monitor AI system operation (Article 26(3))",
-                "Report serious incidents (Article 26(4))",
-                "Keep logs generated by AI system (Article 26(5))",
-                "Conduct fundamental rights impact assessment (Article 27)",
-                "Inform workers about AI monitoring systems (Article 26(7))",
-                "Ensure input data quality (Article 26(6))"
-            ],
-            "deadline": "2027-08-02 (for high-risk systems)",
-            "penalties": "Up to €15M or 3% of global turnover for non-compliance"
-        }
+        role_details["deployer"] = _DEPLOYER_ROLE
     
     # Step 3: Check if IMPORTER
     is_importer = (
@@ -1332,23 +1779,7 @@ def determine_eu_ai_act_role(
     
     if is_importer:
         roles_identified.append("IMPORTER")
-        role_details["importer"] = {
-            "article": "Article 3(5)",
-            "definition": "Places on the market an AI system that bears the name or trademark of a person established outside the EU",
-            "applies_to_you": True,
-            "reason": f"You are based in {company_location} and import AI systems to EU market",
-            "key_obligations": [
-                "Verify provider's conformity assessment (Article 23(1))",
-                "Verify CE marking and documentation (Article 23(2))",
-                "Ensure registration in EU database (Article 23(3))",
-                "Keep copy of technical documentation (Article 23(4))",
-                "Provide authorities with documentation (Article 23(5))",
-                "Ensure storage/transport doesn't affect compliance (Article 23(6))",
-                "Appoint authorized representative in EU (Article 22)"
-            ],
-            "deadline": "2027-08-02",
-            "penalties": "Up to €15M or 3% of global turnover for non-compliance"
-        }
+        role_details["importer"] = _IMPORTER_ROLE
     
     # Step 4: Check if DISTRIBUTOR
     is_distributor = (
@@ -1360,21 +1791,7 @@ def determine_eu_ai_act_role(
     
     if is_distributor:
         roles_identified.append("DISTRIBUTOR")
-        role_details["distributor"] = {
-            "article": "Article 3(6)",
-            "definition": "Makes an AI system available on the market without being the provider or importer",
-            "applies_to_you": True,
-            "reason": "You distribute AI systems in the EU market",
-            "key_obligations": [
-                "Verify CE marking present (Article 24(1))",
-                "Verify required documentation provided (Article 24(2))",
-                "Verify provider/importer obligations met (Article 24(3))",
-                "Inform provider/importer of non-compliance (Article 24(4))",
-                "Cooperate with authorities (Article 24(5))"
-            ],
-            "deadline": "2027-08-02",
-            "penalties": "Up to €15M or 3% of global turnover for non-compliance"
-        }
+        role_details["distributor"] = _DISTRIBUTOR_ROLE
     
     # Step 5: Check if AUTHORIZED REPRESENTATIVE
     is_authorized_rep = (
@@ -1384,20 +1801,7 @@ def determine_eu_ai_act_role(
     
     if is_authorized_rep:
         roles_identified.append("AUTHORIZED REPRESENTATIVE")
-        role_details["authorized_representative"] = {
-            "article": "Article 3(7)",
-            "definition": "Natural or legal person located in the EU who has received a written mandate from a provider outside the EU",
-            "applies_to_you": True,
-            "reason": f"You are based in {company_location} (EU) and represent a non-EU AI provider",
-            "key_obligations": [
-                "Perform tasks specified in mandate (Article 22(1))",
-                "Provide copy of technical documentation to authorities (Article 22(2))",
-                "Cooperate with authorities (Article 22(3))",
-                "Terminate mandate if provider non-compliant (Article 22(4))"
-            ],
-            "deadline": "2027-08-02",
-            "penalties": "Provider's penalties may apply"
-        }
+        role_details["authorized_representative"] = _AUTHORIZED_REPRESENTATIVE_ROLE
     
     # Step 6: Check if PRODUCT MANUFACTURER
     is_product_manufacturer = (
@@ -1407,62 +1811,101 @@ def determine_eu_ai_act_role(
     
     if is_product_manufacturer:
         roles_identified.append("PRODUCT MANUFACTURER")
-        role_details["product_manufacturer"] = {
-            "article": "Article 3(8) + Article 25",
-            "definition": "Manufactures a product and integrates an AI system into it, where the AI is a safety component or the product itself",
-            "applies_to_you": True,
-            "reason": "You integrate AI systems into physical products under your name/trademark",
-            "key_obligations": [
-                "Assume provider obligations for AI component (Article 25(1))",
-                "Ensure AI system complies with requirements (Article 25(2))",
-                "Affix own name/trademark to product (Article 25(3))",
-                "Follow relevant product safety legislation",
-                "Conduct conformity assessment for AI component"
-            ],
-            "deadline": "2027-08-02",
-            "penalties": "Provider penalties apply (up to €15M or 3% of turnover)"
-        }
+        role_details["product_manufacturer"] = _PRODUCT_MANUFACTURER_ROLE
     
     # Determine primary role
     if not roles_identified:
-        return {
-            "primary_role": "NO DIRECT ROLE",
-            "additional_roles": [],
-            "role_details": {},
-            "company_description": company_description,
-            "company_location": company_location,
-            "assessment": "Based on provided information, you may not have direct EU AI Act obligations",
-            "recommendation": "If you interact with AI systems in any way, review the questions again. You may be a deployer if you use AI systems.",
-            "next_steps": [
-                "Verify you are not using AI systems in your operations",
-                "If you are using AI, you are likely a DEPLOYER",
-                "Monitor for regulatory changes that may affect your activities"
-            ]
-        }
+        return _NO_DIRECT_ROLE_RESPONSE
     
     primary_role = roles_identified[0]
-    additional_roles = roles_identified[1:] if len(roles_identified) > 1 else []
+    additional_roles = tuple(roles_identified[1:])
     
-    return {
+    return MappingProxyType({
         "primary_role": primary_role,
         "additional_roles": additional_roles,
-        "all_roles": roles_identified,
-        "role_details": role_details,
-        "company_description": company_description,
-        "company_location": company_location,
+        "all_roles": tuple(roles_identified),
+        "role_details": MappingProxyType(role_details),
+        "company_description": None,
+        "company_location": None,
         "is_eu_based": is_in_eu,
         "total_roles": len(roles_identified),
         "critical_note": "If you have multiple roles, you must comply with ALL obligations for each role",
         "most_common_combination": "Many companies are both PROVIDER (they develop) and DEPLOYER (they use their own AI)",
         "recommendation": f"Focus first on {primary_role} obligations, then address {', '.join(additional_roles) if additional_roles else 'other compliance areas'}",
-        "next_steps": [
+        "next_steps": (
             f"Review all {primary_role} obligations in detail",
             "Determine which AI systems are high-risk vs limited-risk",
             "Create compliance timeline based on deadlines",
             "Assign responsibility for each obligation",
             "Consider consulting legal counsel for complex cases"
-        ]
-    }
+        )
+    })
+
+
+@mcp.tool()
+def determine_eu_ai_act_role(
+    company_description: str,
+    company_location: str,
+    develops_ai_system: bool = False,
+    uses_ai_system: bool = False,
+    sells_ai_system: bool = False,
+    imports_to_eu: bool = False,
+    distributes_in_eu: bool = False,
+    integrates_ai_into_product: bool = False,
+    represents_non_eu_provider: bool = False,
+    under_own_name_or_trademark: bool = False,
+    substantial_modification: bool = False,
+    change_intended_purpose: bool = False
+) -> Dict[str, Any]:
+    """
+    Determine which EU AI Act role(s) apply to your organization.
+    
+    Different roles have different obligations under the EU AI Act.
+    Understanding your role is CRITICAL to knowing which requirements apply.
+    
+    Args:
+        company_description: Brief description of your company/organization
+        company_location: Country/region where company is based
+        develops_ai_system: You develop AI systems or commission their development
+        uses_ai_system: You use AI systems in your operations
+        sells_ai_system: You sell or offer AI systems
+        imports_to_eu: You bring AI systems from outside EU into EU market
+        distributes_in_eu: You distribute/resell AI systems in EU
+        integrates_ai_into_product: You integrate AI into physical products
+        represents_non_eu_provider: You represent a non-EU AI provider in the EU
+        under_own_name_or_trademark: AI system bears your name/trademark
+        substantial_modification: You substantially modify existing AI systems
+        change_intended_purpose: You change the intended purpose of AI systems
+        
+    Returns:
+        Role determination with definitions and applicable obligations
+    """
+    location = company_location.lower()
+    is_in_eu = location in _EU_LOCATIONS or _EU_COUNTRY_RE.search(location) is not None
+    cached = _determine_roles(
+        is_in_eu,
+        develops_ai_system,
+        uses_ai_system,
+        sells_ai_system,
+        imports_to_eu,
+        distributes_in_eu,
+        integrates_ai_into_product,
+        represents_non_eu_provider,
+        under_own_name_or_trademark,
+        substantial_modification,
+        change_intended_purpose
+    )
+    
+    response = cached.copy()
+    response["company_description"] = company_description
+    response["company_location"] = company_location
+    role_details = {role: details.copy() for role, details in cached["role_details"].items()}
+    if "importer" in role_details:
+        role_details["importer"]["reason"] = f"You are based in {company_location} and import AI systems to EU market"
+    if "authorized_representative" in role_details:
+        role_details["authorized_representative"]["reason"] = f"You are based in {company_location} (EU) and represent a non-EU AI provider"
+    response["role_details"] = role_details
+    return response
 
 
 # ============================================================================
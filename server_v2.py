@@ -24,6 +24,9 @@ load_dotenv()
 # Create an MCP server with a name
 mcp = FastMCP("EU_AI_ACT_MCP")
 
+# Directory plugins are loaded from (reported by list_plugins)
+PLUGIN_DIRECTORY = os.path.join(os.path.dirname(__file__), "plugins")
+
 # Create plugin registry
 registry = PluginRegistry()
 
@@ -49,8 +52,8 @@ for tool_name, tool_func in all_tools.items():
 all_resources = registry.get_all_resources()
 
 for resource_uri, resource_func in all_resources.items():
-    # Register each resource with the MCP server
-    mcp.resource(resource_uri)(resource_func)
+    # Register each resource with the MCP server (all plugin resources are JSON)
+    mcp.resource(resource_uri, mime_type="application/json")(resource_func)
 
 # ============================================================================
 # PLUGIN MANAGEMENT TOOL
@@ -78,7 +81,7 @@ def list_plugins() -> dict:
         "plugins": plugins_info,
         "total_tools": len(registry.get_all_tools()),
         "total_resources": len(registry.get_all_resources()),
-        "plugin_directory": os.path.join(os.path.dirname(__file__), "plugins"),
+        "plugin_directory": PLUGIN_DIRECTORY,
         "usage": "Plugins are automatically loaded from the plugins directory"
     }
 
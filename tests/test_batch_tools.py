@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Test script for the label_news_texts, watermark_texts and
+classify_ai_system_risks batch tools
+"""
+
+from server import (
+    label_news_text, label_news_texts, watermark_texts,
+    classify_ai_system_risk, classify_ai_system_risks
+)
+
+
+def test_label_news_texts_matches_single_calls():
+    """Test that batch labeling returns the same results as label_news_text"""
+    print("=" * 70)
+    print("📰 Test 1: Batch news labeling matches single calls")
+    print("=" * 70)
+
+    items = [
+        {"text_content": "Scientists have discovered a new planet."},
+        {"text_content": "Local team wins the cup.", "has_human_editor": True, "editor_name": "Jane Smith"},
+        {"text_content": "El equipo local ganó.", "has_human_editor": True, "language": "es"},
+        {"text_content": "Le gouvernement annonce de nouvelles mesures.", "language": "fr"}
+    ]
+
+    results = label_news_texts(items)
+
+    assert len(results) == len(items)
+    for item, result in zip(items, results):
+        expected = label_news_text(
+            item["text_content"],
+            item.get("has_human_editor", False),
+            item.get("editor_name", ""),
+            item.get("language", "en")
+        )
+        assert result == expected
+        print(f"✓ {result['language']}: {result['disclosure']}")
+    print()
+
+
+def test_label_news_texts_errors():
+    """Test per-item errors in a batch"""
+    print("=" * 70)
+    print("📰 Test 2: Batch news labeling errors")
+    print("=" * 70)
+
+    results = label_news_texts([
+        {"text_content": "Valid article."},
+        {"has_human_editor": True},
+        {"text_content": "Unknown language.", "language": "xx"}
+    ])
+
+    assert "labeled_text" in results[0]
+    assert "error" in results[1]
+    assert "error" in results[2]
+    print(f"✓ Missing text: {results[1]['error']}")
+    print(f"✓ Unknown language: {results[2]['error']}")
+
+    results = label_news_texts([
+        {"text_content": "Valid article."},
+        {"text_content": ["not", "a", "string"]},
+        {"text_content": "Bad editor.", "has_human_editor": True, "editor_name": 42},
+        {"text_content": "Bad language.", "language": None}
+    ])
+
+    assert "labeled_text" in results[0]
+    for result in results[1:]:
+        assert "error" in result
+        print(f"✓ Malformed item: {result['error']}")
+    print()
+
+
+def test_watermark_texts():
+    """Test batch watermarking"""
+    print("=" * 70)
+    print("💧 Test 3: Batch watermarking")
+    print("=" * 70)
+
+    results = watermark_texts([
+        {"text_content": "First AI text.", "generator": "GPT-4"},
+        {"text_content": "Second AI text.", "format_type": "markdown"},
+        {"text_content": "Third AI text.", "format_type": "html"},
+        {"generator": "GPT-4"}
+    ])
+
+    assert len(results) == 4
+    assert results[0]["metadata"]["generator"] == "GPT-4"
+    assert results[0]["watermarked_text"].endswith("First AI text.")
+    assert results[1]["format"] == "markdown"
+    assert results[2]["watermarked_text"].startswith("<!-- AI-Generated Content Metadata")
+    assert "error" in results[3]
+    for result in results[:3]:
+        print(f"✓ {result['format']}: {result['verification']}")
+    print(f"✓ Missing text: {results[3]['error']}")
+
+    results = watermark_texts([
+        {"text_content": "Valid AI text."},
+        {"text_content": b"bytes"},
+        {"text_content": "Bad generator.", "generator": {"name": "GPT-4"}}
+    ])
+
+    assert "watermarked_text" in results[0]
+    for result in results[1:]:
+        assert "error" in result
+        print(f"✓ Malformed item: {result['error']}")
+    print()
+
+
+def test_classify_ai_system_risks():
+    """Test that batch classification matches single calls, with per-item errors"""
+    print("=" * 70)
+    print("⚖️  Test 4: Batch risk classification")
+    print("=" * 70)
+
+    systems = [
+        {"system_description": "Citizen trust score", "use_case": "government", "social_scoring": True},
+        {"system_description": "Resume screening tool", "use_case": "Hiring", "education": True},
+        {"system_description": "Customer support chatbot", "use_case": "chatbot", "interacts_with_users": True},
+        {"system_description": "Spam filter", "use_case": "email"}
+    ]
+
+    results = classify_ai_system_risks(systems + [{"use_case": "hiring"}, {"system_description": "No use case"}])
+
+    assert len(results) == 6
+    for system, result in zip(systems, results):
+        assert result == classify_ai_system_risk(**system)
+        print(f"✓ {system['system_description']}: {result['risk_level']}")
+    assert [r["risk_level"] for r in results[:4]] == ["PROHIBITED", "HIGH-RISK", "LIMITED-RISK", "MINIMAL-RISK"]
+    assert list(results[1]["all_high_risk_factors"]) == [
+        "AI system for employment, recruitment, or HR decisions",
+        "AI system for education or vocational training"
+    ]
+    assert "system_description" in results[4]["error"]
+    assert "use_case" in results[5]["error"]
+    print(f"✓ Missing description: {results[4]['error']}")
+    print(f"✓ Missing use case: {results[5]['error']}")
+    print()
+
+
+def test_classify_ai_system_risks_malformed_items():
+    """Test that malformed items get their own error without failing the batch"""
+    print("=" * 70)
+    print("⚖️  Test 5: Batch risk classification with malformed items")
+    print("=" * 70)
+
+    results = classify_ai_system_risks([
+        {"system_description": "Resume screening tool", "use_case": "hr"},
+        {"system_description": "Bad use case", "use_case": 5},
+        {"system_description": "Bad flag", "use_case": "chatbot", "biometric_data": ["yes"]},
+        "not an object",
+        {"system_description": "Chatbot", "use_case": "chatbot", "interacts_with_users": True}
+    ])
+
+    assert len(results) == 5
+    assert results[0]["risk_level"] == "HIGH-RISK"
+    assert "use_case" in results[1]["error"]
+    assert "biometric_data" in results[2]["error"]
+    assert "error" in results[3]
+    assert results[4]["risk_level"] == "LIMITED-RISK"
+    for result in results[1:4]:
+        print(f"✓ {result['error']}")
+    print()
+
+
+def main():
+    """Run all tests"""
+    print("\n🧪 Testing batch tools\n")
+
+    test_label_news_texts_matches_single_calls()
+    test_label_news_texts_errors()
+    test_watermark_texts()
+    test_classify_ai_system_risks()
+    test_classify_ai_system_risks_malformed_items()
+
+    print("=" * 70)
+    print("✅ All batch tool tests completed!")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test script for the resource-versions://etags resource
+"""
+
+import json
+import os
+import re
+import shutil
+import tempfile
+
+import plugins.common as common
+from server import get_resource_versions
+
+
+RESOURCE_URIS = {
+    "disclosure-templates://ai-interaction-and-emotion",
+    "deepfake-labels://content-labeling",
+    "article50-rules://official-text",
+    "watermark-config://technical-standards"
+}
+
+
+def test_resource_versions_format():
+    """Test that every resource has a 16-hex-digit tag"""
+    print("=" * 70)
+    print("🏷️  Test 1: One 16-hex-digit tag per resource")
+    print("=" * 70)
+
+    versions = json.loads(get_resource_versions())
+
+    assert set(versions) == RESOURCE_URIS
+    for uri, tag in versions.items():
+        assert re.fullmatch(r"[0-9a-f]{16}", tag), f"Bad tag for {uri}: {tag!r}"
+        print(f"✓ {uri}: {tag}")
+    print()
+
+
+def test_resource_versions_stable():
+    """Test that tags do not change between calls"""
+    print("=" * 70)
+    print("🔁 Test 2: Tags are stable across calls")
+    print("=" * 70)
+
+    first = get_resource_versions()
+    second = get_resource_versions()
+
+    assert first == second
+    print("✓ Same tags on repeated calls")
+    print()
+
+
+def test_resource_versions_change_on_edit():
+    """Test that editing a resource file changes only its tag"""
+    print("=" * 70)
+    print("✏️  Test 3: Editing a resource changes its tag")
+    print("=" * 70)
+
+    before = json.loads(get_resource_versions())
+    resources_dir = common.RESOURCES_DIR
+    cache_resources = common.CACHE_RESOURCES
+    temp_dir = tempfile.mkdtemp()
+    try:
+        # Serve from a temp copy of the resources, revalidated by mtime
+        temp_resources = os.path.join(temp_dir, "resources")
+        shutil.copytree(resources_dir, temp_resources)
+        common.RESOURCES_DIR = temp_resources
+        common.CACHE_RESOURCES = False
+
+        assert json.loads(get_resource_versions()) == before
+
+        config_path = os.path.join(temp_resources, "watermark_config.json")
+        with open(config_path, encoding="utf-8") as f:
+            config = json.load(f)
+        config["version"] = config["version"] + "-edited"
+        with open(config_path, "w", encoding="utf-8") as f:
+            json.dump(config, f)
+        # Make sure the mtime differs even on coarse-grained filesystems
+        stat = os.stat(config_path)
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        after = json.loads(get_resource_versions())
+    finally:
+        common.RESOURCES_DIR = resources_dir
+        common.CACHE_RESOURCES = cache_resources
+        common._resource_texts.clear()
+        common._resource_mtimes.clear()
+        shutil.rmtree(temp_dir)
+
+    edited_uri = "watermark-config://technical-standards"
+    assert after[edited_uri] != before[edited_uri]
+    for uri in RESOURCE_URIS - {edited_uri}:
+        assert after[uri] == before[uri]
+    print(f"✓ {edited_uri}: {before[edited_uri]} -> {after[edited_uri]}")
+    print("✓ Other tags unchanged")
+
+    assert json.loads(get_resource_versions()) == before
+    print("✓ Original tags restored")
+    print()
+
+
+def main():
+    """Run all tests"""
+    print("\n🧪 Testing resource versions\n")
+
+    test_resource_versions_format()
+    test_resource_versions_stable()
+    test_resource_versions_change_on_edit()
+
+    print("=" * 70)
+    print("✅ All resource version tests completed!")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
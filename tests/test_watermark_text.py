@@ -6,6 +6,7 @@ Tests adding metadata watermarks to AI-generated text
 
 import sys
 import os
+import json
 
 # Add parent directory to path to import server
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -113,6 +114,60 @@ def test_watermark_text_html():
     return True
 
 
+def test_watermark_text_metadata_roundtrip():
+    """Test that the embedded metadata parses back to the returned metadata"""
+    print(f"\n{'=' * 60}")
+    print("Test 4: Embedded metadata round-trip (all formats)")
+    print("=" * 60)
+    
+    original_text = "Texte généré par IA."
+    headers = {
+        "plain": ("[AI-WATERMARK:", "]\n\n"),
+        "markdown": ("<!-- AI Watermark: ", " -->\n\n"),
+        "html": ("<!-- AI-Generated Content Metadata\n", "\n-->\n")
+    }
+    
+    for format_type, (start, end) in headers.items():
+        result = watermark_text(
+            text_content=original_text,
+            generator='Model "X" 100%',
+            format_type=format_type
+        )
+        watermarked = result['watermarked_text']
+        embedded = watermarked[len(start):watermarked.index(end)]
+        
+        assert watermarked.startswith(start)
+        assert watermarked.endswith(original_text)
+        assert json.loads(embedded) == result['metadata']
+        assert result['watermarked_length'] == len(watermarked)
+        print(f"✓ {format_type}: metadata round-trips")
+    
+    print(f"\n✅ Metadata round-trip test PASSED!")
+
+
+def test_watermark_text_header_only():
+    """Test that header_only returns the header the full result starts with"""
+    print(f"\n{'=' * 60}")
+    print("Test 5: Header-only mode (all formats)")
+    print("=" * 60)
+    
+    original_text = "A long AI-generated article. " * 100
+    
+    for format_type in ["plain", "markdown", "html"]:
+        full = watermark_text(original_text, "GPT-4", format_type)
+        result = watermark_text(original_text, "GPT-4", format_type, header_only=True)
+        header = result['watermark_header']
+        
+        assert 'watermarked_text' not in result
+        assert result['metadata']['content_hash'] == full['metadata']['content_hash']
+        assert result['watermarked_length'] == len(header + original_text)
+        assert full['watermarked_text'].endswith(original_text)
+        assert len(full['watermarked_text']) - len(original_text) == len(header)
+        print(f"✓ {format_type}: header is {len(header)} chars")
+    
+    print(f"\n✅ Header-only test PASSED!")
+
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 60)
@@ -123,6 +178,8 @@ def main():
         test_watermark_text_plain()
         test_watermark_text_markdown()
         test_watermark_text_html()
+        test_watermark_text_metadata_roundtrip()
+        test_watermark_text_header_only()
         
         print("\n" + "=" * 60)
         print("✅ ALL TESTS PASSED!")